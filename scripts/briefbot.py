@@ -75,6 +75,7 @@ class ResearchBundle:
     needs_web: bool = False
 
 
+@http_client.releases_pool
 def _query_reddit(
     topic: str,
     cfg: dict,
@@ -83,6 +84,7 @@ def _query_reddit(
     end_date: str,
     sampling: str,
     mock: bool,
+    use_cache: bool = True,
 ) -> tuple:
     """Query Reddit via OpenAI web search API. Returns (items, response, error)."""
     response = None
@@ -99,6 +101,7 @@ def _query_reddit(
                 start_date,
                 end_date,
                 sampling=sampling,
+                use_cache=use_cache,
             )
         except http_client.HTTPError as network_err:
             response = {"error": str(network_err)}
@@ -125,6 +128,7 @@ def _query_reddit(
                     start_date,
                     end_date,
                     sampling=sampling,
+                    use_cache=use_cache,
                 )
                 supplemental_items = reddit_source.parse_reddit_response(supplemental_response)
 
@@ -149,6 +153,7 @@ def _query_reddit(
     return items, response, error
 
 
+@http_client.releases_pool
 def _query_x(
     topic: str,
     cfg: dict,
@@ -224,6 +229,7 @@ def _query_x(
     return items, response, error
 
 
+@http_client.releases_pool
 def _query_youtube(
     topic: str,
     cfg: dict,
@@ -261,6 +267,7 @@ def _query_youtube(
     return items, response, error
 
 
+@http_client.releases_pool
 def _query_linkedin(
     topic: str,
     cfg: dict,
@@ -269,6 +276,7 @@ def _query_linkedin(
     end_date: str,
     sampling: str,
     mock: bool,
+    use_cache: bool = True,
 ) -> tuple:
     """Query LinkedIn via OpenAI web search API. Returns (items, response, error)."""
     response = None
@@ -285,6 +293,7 @@ def _query_linkedin(
                 start_date,
                 end_date,
                 sampling=sampling,
+                use_cache=use_cache,
             )
         except http_client.HTTPError as network_err:
             response = {"error": str(network_err)}
@@ -308,6 +317,7 @@ def run_research(
     sampling: str = "standard",
     mock: bool = False,
     progress: console.Progress = None,
+    use_cache: bool = True,
 ) -> ResearchBundle:
     """Orchestrate the full research pipeline across all platforms."""
     bundle = ResearchBundle(
@@ -371,6 +381,7 @@ def run_research(
                 end_date,
                 sampling,
                 mock,
+                use_cache,
             )] = "reddit"
 
         if should_query_x:
@@ -409,6 +420,7 @@ def run_research(
                 end_date,
                 sampling,
                 mock,
+                use_cache,
             )] = "linkedin"
 
         for future in as_completed(futures):
@@ -520,6 +532,11 @@ def main():
         default="standard",
         help="Sampling intensity (lite/standard/dense)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached provider responses and pull fresh results",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -713,6 +730,7 @@ def main():
         sampling,
         args.mock,
         progress,
+        use_cache=not args.refresh,
     )
 
     # Begin post-processing phase
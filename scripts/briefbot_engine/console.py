@@ -1,5 +1,6 @@
 """Terminal progress UI primitives."""
 
+import itertools
 import os
 import sys
 import time
@@ -30,20 +31,46 @@ def _enable_windows_vt_processing():
 _enable_windows_vt_processing()
 
 IS_TTY = bool(getattr(sys.stderr, "isatty", lambda: False)())
+# A dumb terminal is a TTY that cannot redraw a line, so it gets the static
+# output path too: no animation thread, no per-tick sleep, no clear-line.
+ANIMATED = IS_TTY and os.environ.get("TERM") != "dumb"
+
+
+def _flush():
+    """Flush stderr only when a terminal is watching.
+
+    stderr is line-buffered, so every line already reaches a pipe or log
+    file on its newline; the explicit flush only matters for the partial
+    lines a terminal redraws. sys.stderr is looked up per call rather than
+    bound at import so redirection (and test capture) keeps working.
+    """
+    if IS_TTY:
+        sys.stderr.flush()
+
+
+def _sgr(*codes: str) -> str:
+    """One SGR escape carrying every parameter, e.g. _sgr("1", "2") -> ESC[1;2m."""
+    return "\033[" + ";".join(codes) + "m"
 
 
 class Style:
     """ANSI escape codes for terminal styling."""
 
-    MAGENTA = "\033[38;5;171m"
-    AZURE = "\033[38;5;75m"
-    TEAL = "\033[38;5;44m"
-    LIME = "\033[38;5;40m"
-    AMBER = "\033[38;5;214m"
-    CRIMSON = "\033[38;5;196m"
-    EMPHASIZED = "\033[1m"
-    SUBDUED = "\033[2m"
-    NORMAL = "\033[0m"
+    MAGENTA = _sgr("38;5;171")
+    AZURE = _sgr("38;5;75")
+    TEAL = _sgr("38;5;44")
+    LIME = _sgr("38;5;40")
+    AMBER = _sgr("38;5;214")
+    CRIMSON = _sgr("38;5;196")
+    EMPHASIZED = _sgr("1")
+    SUBDUED = _sgr("2")
+    NORMAL = _sgr("0")
+    # Combined forms, so the terminal parses one sequence instead of two.
+    MAGENTA_BOLD = _sgr("38;5;171", "1")
+    AMBER_BOLD = _sgr("38;5;214", "1")
+    LIME_BOLD = _sgr("38;5;40", "1")
+    SUBDUED_BOLD = _sgr("2", "1")
+    NORMAL_SUBDUED = _sgr("0", "2")
 
 
 if "NO_COLOR" in os.environ:
@@ -57,22 +84,39 @@ if "NO_COLOR" in os.environ:
         "EMPHASIZED",
         "SUBDUED",
         "NORMAL",
+        "MAGENTA_BOLD",
+        "AMBER_BOLD",
+        "LIME_BOLD",
+        "SUBDUED_BOLD",
+        "NORMAL_SUBDUED",
     ):
         setattr(Style, _attr, "")
 
+# Styled source labels, built once instead of per progress call.
+LABEL_REDDIT = f"{Style.AMBER}Reddit{Style.NORMAL} "
+LABEL_X = f"{Style.AZURE}X{Style.NORMAL} "
+LABEL_PROCESS = f"{Style.MAGENTA}Processing{Style.NORMAL} "
+LABEL_WEB = f"{Style.LIME}Web{Style.NORMAL} "
+LABEL_AUDIO = f"{Style.MAGENTA}Audio{Style.NORMAL} "
+CHECKMARK = f"{Style.LIME}\u2713{Style.NORMAL} "
+SECTION_RULE = Style.SUBDUED_BOLD + "\u2500" * 44 + Style.NORMAL
+# Carriage return + "erase entire line" (CSI 2K): 5 bytes instead of
+# overwriting with 120 spaces, and it also clears lines wider than 120.
+CLEAR_LINE = "\r\033[2K"
+
 
 HEADER_ART = (
-    f"{Style.MAGENTA}{Style.EMPHASIZED}\n"
+    f"{Style.MAGENTA_BOLD}\n"
     "   \u2588\u2588\u2588\u2588\u2588\u2588\u2557 \u2588\u2588\u2588\u2588\u2588\u2557 \u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2557 \u2588\u2588\u2588\u2588\u2588\u2588\u2557\u2588\u2588\u2557  \u2588\u2588\u2557\u2588\u2588\u2557   \u2588\u2588\u2557\u2588\u2588\u2588\u2588\u2588\u2588\u2557\n"
     "  \u2588\u2588\u2554\u2550\u2550\u2550\u2550\u255d\u2588\u2588\u2554\u2550\u2550\u2588\u2588\u2557\u255a\u2550\u2550\u2588\u2588\u2554\u2550\u2550\u255d\u2588\u2588\u2554\u2550\u2550\u2550\u2550\u255d\u2588\u2588\u2551  \u2588\u2588\u2551\u2588\u2588\u2551   \u2588\u2588\u2551\u2588\u2588\u2554\u2550\u2550\u2588\u2588\u2557\n"
     "  \u2588\u2588\u2551     \u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2551   \u2588\u2588\u2551   \u2588\u2588\u2551     \u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2551\u2588\u2588\u2551   \u2588\u2588\u2551\u2588\u2588\u2588\u2588\u2588\u2588\u2554\u255d\n"
     "  \u2588\u2588\u2551     \u2588\u2588\u2554\u2550\u2550\u2588\u2588\u2551   \u2588\u2588\u2551   \u2588\u2588\u2551     \u2588\u2588\u2554\u2550\u2550\u2588\u2588\u2551\u2588\u2588\u2551   \u2588\u2588\u2551\u2588\u2588\u2554\u2550\u2550\u2550\u255d\n"
     "  \u255a\u2588\u2588\u2588\u2588\u2588\u2588\u2557\u2588\u2588\u2551  \u2588\u2588\u2551   \u2588\u2588\u2551   \u255a\u2588\u2588\u2588\u2588\u2588\u2588\u2557\u2588\u2588\u2551  \u2588\u2588\u2551\u255a\u2588\u2588\u2588\u2588\u2588\u2588\u2554\u255d\u2588\u2588\u2551\n"
     "   \u255a\u2550\u2550\u2550\u2550\u2550\u255d\u255a\u2550\u255d  \u255a\u2550\u255d   \u255a\u2550\u255d    \u255a\u2550\u2550\u2550\u2550\u2550\u255d\u255a\u2550\u255d  \u255a\u2550\u255d \u255a\u2550\u2550\u2550\u2550\u2550\u255d \u255a\u2550\u255d\n"
-    f"{Style.NORMAL}{Style.SUBDUED}  Deep research, instant delivery.{Style.NORMAL}\n"
+    f"{Style.NORMAL_SUBDUED}  Deep research, instant delivery.{Style.NORMAL}\n"
 )
 
-COMPACT_HEADER = f"{Style.MAGENTA}{Style.EMPHASIZED}/briefbot{Style.NORMAL} {Style.SUBDUED}\u00b7 researching...{Style.NORMAL}"
+COMPACT_HEADER = f"{Style.MAGENTA_BOLD}/briefbot{Style.NORMAL} {Style.SUBDUED}\u00b7 researching...{Style.NORMAL}"
 
 REDDIT_MSGS = [
     "Scouring subreddit discussions...",
@@ -124,8 +168,22 @@ TTS_MSGS = [
     "Synthesizing narration...",
 ]
 
+
+def _rotation(messages):
+    """Endless round-robin over *messages* in an order shuffled once at import."""
+    return itertools.cycle(random.sample(messages, len(messages)))
+
+
+_REDDIT_CYCLE = _rotation(REDDIT_MSGS)
+_X_CYCLE = _rotation(X_MSGS)
+_ENRICH_CYCLE = _rotation(ENRICH_MSGS)
+_PROCESS_CYCLE = _rotation(PROCESS_MSGS)
+_WEB_CYCLE = _rotation(WEB_MSGS)
+_TTS_CYCLE = _rotation(TTS_MSGS)
+
+
 UPGRADE_NOTICE = f"""
-{Style.AMBER}{Style.EMPHASIZED}\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501{Style.NORMAL}
+{Style.AMBER_BOLD}\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501{Style.NORMAL}
 {Style.AMBER}\u26a1 UNLOCK THE FULL POWER OF /briefbot{Style.NORMAL}
 
 {Style.SUBDUED}Right now you're using web search only. Add API keys to unlock:{Style.NORMAL}
@@ -139,12 +197,12 @@ UPGRADE_NOTICE = f"""
      \u2514\u2500 Add XAI_API_KEY (uses xAI's live X search)
 
 {Style.SUBDUED}Setup:{Style.NORMAL} Edit {Style.EMPHASIZED}~/.config/briefbot/briefbot.env{Style.NORMAL} {Style.SUBDUED}(legacy .env also supported){Style.NORMAL}
-{Style.AMBER}{Style.EMPHASIZED}\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501{Style.NORMAL}
+{Style.AMBER_BOLD}\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501{Style.NORMAL}
 """
 
 SINGLE_KEY_HINTS = {
-    "reddit": f"\n{Style.SUBDUED}\U0001f4a1 Tip: Add {Style.AMBER}OPENAI_API_KEY{Style.NORMAL}{Style.SUBDUED} to ~/.config/briefbot/briefbot.env (or legacy .env) for Reddit, YouTube & LinkedIn data!{Style.NORMAL}\n",
-    "x": f"\n{Style.SUBDUED}\U0001f4a1 Tip: Add {Style.TEAL}XAI_API_KEY{Style.NORMAL}{Style.SUBDUED} to ~/.config/briefbot/briefbot.env (or legacy .env) for X/Twitter data with real likes & reposts!{Style.NORMAL}\n",
+    "reddit": f"\n{Style.SUBDUED}\U0001f4a1 Tip: Add {Style.AMBER}OPENAI_API_KEY{Style.NORMAL_SUBDUED} to ~/.config/briefbot/briefbot.env (or legacy .env) for Reddit, YouTube & LinkedIn data!{Style.NORMAL}\n",
+    "x": f"\n{Style.SUBDUED}\U0001f4a1 Tip: Add {Style.TEAL}XAI_API_KEY{Style.NORMAL_SUBDUED} to ~/.config/briefbot/briefbot.env (or legacy .env) for X/Twitter data with real likes & reposts!{Style.NORMAL}\n",
 }
 
 SPIN_CHARS = ["\u25dc", "\u25dd", "\u25de", "\u25df"]
@@ -156,24 +214,31 @@ class Spinner:
     def __init__(self, status_text: str = "Working", style_code: str = Style.TEAL):
         self.status_text = status_text
         self.style_code = style_code
-        self.active = False
+        # Set by stop(); the animation thread sleeps on it, so stopping
+        # wakes the thread at once instead of after the rest of a tick.
+        self._stopped = threading.Event()
         self.animation_thread: Optional[threading.Thread] = None
         self.frame_position = 0
         self.static_displayed = False
+        self._animated = ANIMATED
 
     def _animate(self):
-        while self.active:
+        # Each frame is one pre-joined string: a single write and flush per tick.
+        stopped = self._stopped
+        while not stopped.is_set():
             frame = SPIN_CHARS[self.frame_position % len(SPIN_CHARS)]
-            sys.stderr.write(
-                f"\r{self.style_code}{frame}{Style.NORMAL} {self.status_text}  "
-            )
+            sys.stderr.write(f"\r{self.style_code}{frame}{Style.NORMAL} {self.status_text}  ")
             sys.stderr.flush()
             self.frame_position += 1
-            time.sleep(0.1)
+            stopped.wait(0.1)
+
+    @property
+    def active(self) -> bool:
+        return not self._stopped.is_set()
 
     def start(self):
-        self.active = True
-        if IS_TTY:
+        self._stopped.clear()
+        if self._animated:
             self.animation_thread = threading.Thread(target=self._animate, daemon=True)
             self.animation_thread.start()
         else:
@@ -181,24 +246,29 @@ class Spinner:
                 sys.stderr.write(
                     f"{self.style_code}\u25cf{Style.NORMAL} {self.status_text}\n"
                 )
-                sys.stderr.flush()
+                _flush()
                 self.static_displayed = True
 
     def update(self, new_status: str):
         self.status_text = new_status
-        if not IS_TTY and not self.static_displayed:
+        if not self._animated and not self.static_displayed:
             sys.stderr.write(f"{self.style_code}\u25cf{Style.NORMAL} {new_status}\n")
-            sys.stderr.flush()
+            _flush()
 
     def stop(self, completion_message: str = ""):
-        self.active = False
+        self._stopped.set()
+        if not self._animated:
+            if completion_message:
+                sys.stderr.write(CHECKMARK + completion_message + "\n")
+                _flush()
+            return
         if self.animation_thread:
             self.animation_thread.join(timeout=0.35)
-        if IS_TTY:
-            sys.stderr.write("\r" + (" " * 120) + "\r")
-        if completion_message:
-            sys.stderr.write(f"{Style.LIME}\u2713{Style.NORMAL} {completion_message}\n")
-        sys.stderr.flush()
+        # Clear-line and checkmark go out as one write so the line never
+        # flashes empty between them.
+        done = CHECKMARK + completion_message + "\n" if completion_message else ""
+        sys.stderr.write(CLEAR_LINE + done)
+        _flush()
 
 
 class Progress:
@@ -213,64 +283,52 @@ class Progress:
             self._display_header()
 
     def _display_header(self):
-        sys.stderr.write(f"{COMPACT_HEADER}\n")
         sys.stderr.write(
+            f"{COMPACT_HEADER}\n"
             f"{Style.SUBDUED}Topic: {Style.NORMAL}{Style.EMPHASIZED}{self.subject_matter}{Style.NORMAL}\n\n"
         )
-        sys.stderr.flush()
+        _flush()
 
     def begin_reddit(self):
-        msg = random.choice(REDDIT_MSGS)
-        self.indicator = Spinner(
-            f"{Style.AMBER}Reddit{Style.NORMAL} {msg}", Style.AMBER
-        )
+        msg = next(_REDDIT_CYCLE)
+        self.indicator = Spinner(LABEL_REDDIT + msg, Style.AMBER)
         self.indicator.start()
 
     def finish_reddit(self, item_count: int):
         if self.indicator:
-            self.indicator.stop(
-                f"{Style.AMBER}Reddit{Style.NORMAL} Found {item_count} threads"
-            )
+            self.indicator.stop(f"{LABEL_REDDIT}Found {item_count} threads")
 
     def begin_thread_hydration(self, current_position: int, total_count: int):
         if self.indicator:
             self.indicator.stop()
-        msg = random.choice(ENRICH_MSGS)
+        msg = next(_ENRICH_CYCLE)
         self.indicator = Spinner(
-            f"{Style.AMBER}Reddit{Style.NORMAL} [{current_position}/{total_count}] {msg}",
+            f"{LABEL_REDDIT}[{current_position}/{total_count}] {msg}",
             Style.AMBER,
         )
         self.indicator.start()
 
     def update_thread_hydration(self, current_position: int, total_count: int):
         if self.indicator:
-            msg = random.choice(ENRICH_MSGS)
-            self.indicator.update(
-                f"{Style.AMBER}Reddit{Style.NORMAL} [{current_position}/{total_count}] {msg}"
-            )
+            msg = next(_ENRICH_CYCLE)
+            self.indicator.update(f"{LABEL_REDDIT}[{current_position}/{total_count}] {msg}")
 
     def finish_thread_hydration(self):
         if self.indicator:
-            self.indicator.stop(
-                f"{Style.AMBER}Reddit{Style.NORMAL} Enriched with engagement data"
-            )
+            self.indicator.stop(LABEL_REDDIT + "Enriched with engagement data")
 
     def begin_x(self):
-        msg = random.choice(X_MSGS)
-        self.indicator = Spinner(f"{Style.AZURE}X{Style.NORMAL} {msg}", Style.AZURE)
+        msg = next(_X_CYCLE)
+        self.indicator = Spinner(LABEL_X + msg, Style.AZURE)
         self.indicator.start()
 
     def finish_x(self, item_count: int):
         if self.indicator:
-            self.indicator.stop(
-                f"{Style.AZURE}X{Style.NORMAL} Found {item_count} posts"
-            )
+            self.indicator.stop(f"{LABEL_X}Found {item_count} posts")
 
     def begin_scoring(self):
-        msg = random.choice(PROCESS_MSGS)
-        self.indicator = Spinner(
-            f"{Style.MAGENTA}Processing{Style.NORMAL} {msg}", Style.MAGENTA
-        )
+        msg = next(_PROCESS_CYCLE)
+        self.indicator = Spinner(LABEL_PROCESS + msg, Style.MAGENTA)
         self.indicator.start()
 
     def finish_scoring(self):
@@ -285,26 +343,21 @@ class Progress:
         linkedin_count: int = 0,
     ):
         elapsed = time.time() - self.start_timestamp
-        sep = f"{Style.SUBDUED}{Style.EMPHASIZED}\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500{Style.NORMAL}"
-        sys.stderr.write(f"\n{sep}\n")
-        sys.stderr.write(
-            f"{Style.LIME}{Style.EMPHASIZED}\u2713 Research complete{Style.NORMAL} "
-        )
-        sys.stderr.write(f"{Style.SUBDUED}({elapsed:.1f}s){Style.NORMAL}\n")
-        sys.stderr.write(
-            f"  {Style.TEAL}Reddit:{Style.NORMAL} {reddit_count} threads  "
-        )
-        sys.stderr.write(f"{Style.AMBER}X:{Style.NORMAL} {x_count} posts")
+        # Staged and written once, so the block lands in a single write.
+        parts = [
+            f"\n{SECTION_RULE}\n",
+            f"{Style.LIME_BOLD}\u2713 Research complete{Style.NORMAL} ",
+            f"{Style.SUBDUED}({elapsed:.1f}s){Style.NORMAL}\n",
+            f"  {Style.TEAL}Reddit:{Style.NORMAL} {reddit_count} threads  ",
+            f"{Style.AMBER}X:{Style.NORMAL} {x_count} posts",
+        ]
         if youtube_count > 0:
-            sys.stderr.write(
-                f"  {Style.AZURE}YouTube:{Style.NORMAL} {youtube_count} videos"
-            )
+            parts.append(f"  {Style.AZURE}YouTube:{Style.NORMAL} {youtube_count} videos")
         if linkedin_count > 0:
-            sys.stderr.write(
-                f"  {Style.MAGENTA}LinkedIn:{Style.NORMAL} {linkedin_count} posts"
-            )
-        sys.stderr.write(f"\n{sep}\n\n")
-        sys.stderr.flush()
+            parts.append(f"  {Style.MAGENTA}LinkedIn:{Style.NORMAL} {linkedin_count} posts")
+        parts.append(f"\n{SECTION_RULE}\n\n")
+        sys.stderr.write("".join(parts))
+        _flush()
 
     def show_cache_notice(self, cache_age_hours: float = None):
         age_display = (
@@ -313,63 +366,55 @@ class Progress:
         sys.stderr.write(
             f"{Style.LIME}\u26a1{Style.NORMAL} {Style.SUBDUED}Cache hit{age_display}. Add --refresh to force a live pull.{Style.NORMAL}\n\n"
         )
-        sys.stderr.flush()
+        _flush()
 
     def report_error(self, error_description: str):
         sys.stderr.write(
             f"{Style.CRIMSON}\u2717 Error:{Style.NORMAL} {error_description}\n"
         )
-        sys.stderr.flush()
+        _flush()
 
     def begin_web_only(self):
-        msg = random.choice(WEB_MSGS)
-        self.indicator = Spinner(f"{Style.LIME}Web{Style.NORMAL} {msg}", Style.LIME)
+        msg = next(_WEB_CYCLE)
+        self.indicator = Spinner(LABEL_WEB + msg, Style.LIME)
         self.indicator.start()
 
     def finish_web_only(self):
         if self.indicator:
-            self.indicator.stop(
-                f"{Style.LIME}Web{Style.NORMAL} Ready for web-only synthesis"
-            )
+            self.indicator.stop(LABEL_WEB + "Ready for web-only synthesis")
 
     def show_web_only_summary(self):
         elapsed = time.time() - self.start_timestamp
-        sep = f"{Style.SUBDUED}{Style.EMPHASIZED}\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500{Style.NORMAL}"
-        sys.stderr.write(f"\n{sep}\n")
-        sys.stderr.write(
-            f"{Style.LIME}{Style.EMPHASIZED}\u2713 Ready for web search{Style.NORMAL} "
-        )
-        sys.stderr.write(f"{Style.SUBDUED}({elapsed:.1f}s){Style.NORMAL}\n")
         sys.stderr.write(
+            f"\n{SECTION_RULE}\n"
+            f"{Style.LIME_BOLD}\u2713 Ready for web search{Style.NORMAL} "
+            f"{Style.SUBDUED}({elapsed:.1f}s){Style.NORMAL}\n"
             f"  {Style.LIME}Web:{Style.NORMAL} Ready to gather blogs, docs & news\n"
+            f"{SECTION_RULE}\n\n"
         )
-        sys.stderr.write(f"{sep}\n\n")
-        sys.stderr.flush()
+        _flush()
 
     def begin_audio(self):
-        msg = random.choice(TTS_MSGS)
-        self.indicator = Spinner(
-            f"{Style.MAGENTA}Audio{Style.NORMAL} {msg}", Style.MAGENTA
-        )
+        msg = next(_TTS_CYCLE)
+        self.indicator = Spinner(LABEL_AUDIO + msg, Style.MAGENTA)
         self.indicator.start()
 
     def finish_audio(self, output_file: str):
         if self.indicator:
-            self.indicator.stop(
-                f"{Style.MAGENTA}Audio{Style.NORMAL} Saved to {output_file}"
-            )
+            self.indicator.stop(f"{LABEL_AUDIO}Saved to {output_file}")
 
     def show_upgrade_notice(self, missing_keys: str = "both"):
         if missing_keys == "both":
             sys.stderr.write(UPGRADE_NOTICE)
         elif missing_keys in SINGLE_KEY_HINTS:
             sys.stderr.write(SINGLE_KEY_HINTS[missing_keys])
-        sys.stderr.flush()
+        _flush()
 
 
-def phase_status(phase_name: str, status_text: str):
-    """Print a single phase-status line to stderr."""
-    phase_styles = {
+# Fully styled "\u25b8 " prefix per phase, built once at import.
+_PHASE_PREFIX = {
+    name: f"{color}\u25b8{Style.NORMAL} "
+    for name, color in {
         "reddit": Style.TEAL,
         "x": Style.AMBER,
         "process": Style.AZURE,
@@ -377,7 +422,12 @@ def phase_status(phase_name: str, status_text: str):
         "error": Style.CRIMSON,
         "youtube": Style.MAGENTA,
         "linkedin": Style.AZURE,
-    }
-    color = phase_styles.get(phase_name, Style.NORMAL)
-    sys.stderr.write(f"{color}\u25b8{Style.NORMAL} {status_text}\n")
-    sys.stderr.flush()
+    }.items()
+}
+_DEFAULT_PHASE_PREFIX = f"{Style.NORMAL}\u25b8{Style.NORMAL} "
+
+
+def phase_status(phase_name: str, status_text: str):
+    """Print a single phase-status line to stderr."""
+    sys.stderr.write(_PHASE_PREFIX.get(phase_name, _DEFAULT_PHASE_PREFIX) + status_text + "\n")
+    _flush()
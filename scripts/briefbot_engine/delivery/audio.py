@@ -18,6 +18,20 @@ ELEVENLABS_DEFAULT_VOICE = "Rachel"  # Clear, professional female voice
 ELEVENLABS_VOICES_URL = "https://api.elevenlabs.io/v1/voices"
 
 
+# Speech-cleanup patterns, compiled once at import (applied in this order).
+_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_STAR_EMPHASIS_RE = re.compile(r'\*{1,3}([^*]+)\*{1,3}')
+_UNDERSCORE_EMPHASIS_RE = re.compile(r'_{1,3}([^_]+)_{1,3}')
+_URL_RE = re.compile(r'https?://\S+')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_SCORE_TAG_RE = re.compile(r'\(score:\d+\)')
+_ID_TAG_RE = re.compile(r'\*\*[A-Z]\d{2,}\*\*')
+_SEPARATOR_RE = re.compile(r'^[=\-]{3,}$', re.MULTILINE)
+_STRUCTURAL_LINE_RE = re.compile(r'^(?:Mode|Date range|Models):.*$', re.MULTILINE)
+_TREE_GLYPH_RE = re.compile(r'[^\S\n]*[├└─│]+[^\S\n]*')
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+
+
 def clean_text_for_speech(raw_text: str) -> str:
     """
     Strips markdown formatting, URLs, and noise from research output
@@ -26,35 +40,33 @@ def clean_text_for_speech(raw_text: str) -> str:
     text = raw_text
 
     # Remove markdown headers (### Header -> Header)
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    text = _HEADER_RE.sub('', text)
 
     # Remove markdown bold/italic
-    text = re.sub(r'\*{1,3}([^*]+)\*{1,3}', r'\1', text)
-    text = re.sub(r'_{1,3}([^_]+)_{1,3}', r'\1', text)
+    text = _STAR_EMPHASIS_RE.sub(r'\1', text)
+    text = _UNDERSCORE_EMPHASIS_RE.sub(r'\1', text)
 
     # Remove URLs
-    text = re.sub(r'https?://\S+', '', text)
+    text = _URL_RE.sub('', text)
 
     # Remove markdown links [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    text = _LINK_RE.sub(r'\1', text)
 
     # Remove score/ID tags like (score:42) or **R01**
-    text = re.sub(r'\(score:\d+\)', '', text)
-    text = re.sub(r'\*\*[A-Z]\d{2,}\*\*', '', text)
+    text = _SCORE_TAG_RE.sub('', text)
+    text = _ID_TAG_RE.sub('', text)
 
     # Remove separator lines (=== or ---)
-    text = re.sub(r'^[=\-]{3,}$', '', text, flags=re.MULTILINE)
+    text = _SEPARATOR_RE.sub('', text)
 
-    # Remove lines that are purely structural (Mode:, Date range:, etc.)
-    text = re.sub(r'^Mode:.*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^Date range:.*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^Models:.*$', '', text, flags=re.MULTILINE)
+    # Remove lines that are purely structural (Mode:, Date range:, Models:)
+    text = _STRUCTURAL_LINE_RE.sub('', text)
 
     # Remove emoji-heavy stat lines but keep the text
-    text = re.sub(r'[^\S\n]*[├└─│]+[^\S\n]*', ' ', text)
+    text = _TREE_GLYPH_RE.sub(' ', text)
 
     # Collapse multiple blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _BLANK_RUN_RE.sub('\n\n', text)
 
     # Strip leading/trailing whitespace per line
     lines = [line.strip() for line in text.split('\n')]
@@ -3,14 +3,16 @@
 # Uses stdlib smtplib for zero external dependencies
 #
 
+import base64
 import mimetypes
 import re
 import smtplib
+from contextlib import contextmanager
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 def validate_smtp_config(config: Dict[str, Any]) -> Optional[str]:
@@ -31,6 +33,62 @@ def validate_smtp_config(config: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+# Markdown -> news HTML patterns, compiled once at import
+_CODE_BLOCK_RE = re.compile(r"```[\w]*\n(.*?)```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_HEADER_RE = re.compile(r"^(#{1,3}) (.+)$", re.MULTILINE)
+_BOLD_ITALIC_RE = re.compile(r"\*\*\*(.+?)\*\*\*")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_LIST_ITEM_RE = re.compile(r"^[*\-] (.+)$", re.MULTILINE)
+_LIST_RUN_RE = re.compile(r"((?:<li[^>]*>.*?</li>\s*)+)", re.DOTALL)
+_RULE_RE = re.compile(r"^(?:---+|===+)$", re.MULTILINE)
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\n+")
+
+_CODE_BLOCK_HTML = (
+    r'<pre style="background:#f8f9fa;padding:14px 16px;border-radius:6px;'
+    r'overflow-x:auto;font-size:13px;line-height:1.5;border:1px solid #e9ecef;'
+    r'font-family:Consolas,Monaco,monospace;">\1</pre>'
+)
+_INLINE_CODE_HTML = (
+    r'<code style="background:#f0f1f3;padding:2px 6px;border-radius:3px;'
+    r'font-size:0.9em;font-family:Consolas,Monaco,monospace;">\1</code>'
+)
+# Headers — white text on dark background for dark-mode resilience.
+# Keyed by the number of leading '#': (opening tag, closing tag).
+_HEADER_TAGS = {
+    3: (
+        '<h3 style="font-size:16px;font-weight:700;color:#ffffff;margin:24px 0 8px 0;'
+        'padding:8px 12px;background:#1a1a2e;border-radius:4px;line-height:1.3;">',
+        "</h3>",
+    ),
+    2: (
+        '<h2 style="font-size:20px;font-weight:700;color:#ffffff;margin:32px 0 12px 0;'
+        'padding:10px 14px;background:linear-gradient(135deg,#1a1a2e,#0f3460);border-radius:6px;line-height:1.3;">',
+        "</h2>",
+    ),
+    1: (
+        '<h1 style="font-size:26px;font-weight:800;color:#ffffff;margin:0 0 16px 0;'
+        'padding:12px 16px;background:linear-gradient(135deg,#1a1a2e,#0f3460);border-radius:8px;line-height:1.2;">',
+        "</h1>",
+    ),
+}
+_LINK_HTML = (
+    r'<a href="\2" style="color:#4361ee;text-decoration:none;'
+    r'border-bottom:1px solid #4361ee40;">\1</a>'
+)
+_LIST_ITEM_HTML = r'<li style="margin-bottom:6px;line-height:1.6;">\1</li>'
+_LIST_HTML = r'<ul style="padding-left:20px;margin:12px 0;">\1</ul>'
+_RULE_HTML = '<hr style="border:none;border-top:1px solid #e0e0e0;margin:28px 0;">'
+_PARAGRAPH_HTML = '<p style="margin:0 0 14px 0;line-height:1.7;color:#2d2d2d;">'
+
+
+def _header_html(match: "re.Match[str]") -> str:
+    opening, closing = _HEADER_TAGS[len(match.group(1))]
+    return opening + match.group(2) + closing
+
+
 def _markdown_to_news_html(markdown_text: str) -> str:
     """
     Converts markdown to polished news-site-style HTML for email.
@@ -45,105 +103,38 @@ def _markdown_to_news_html(markdown_text: str) -> str:
     html = html.replace("<", "&lt;")
     html = html.replace(">", "&gt;")
 
-    # Code blocks (``` ... ```)
-    html = re.sub(
-        r"```[\w]*\n(.*?)```",
-        r'<pre style="background:#f8f9fa;padding:14px 16px;border-radius:6px;'
-        r'overflow-x:auto;font-size:13px;line-height:1.5;border:1px solid #e9ecef;'
-        r'font-family:Consolas,Monaco,monospace;">\1</pre>',
-        html,
-        flags=re.DOTALL,
-    )
-
-    # Inline code
-    html = re.sub(
-        r"`([^`]+)`",
-        r'<code style="background:#f0f1f3;padding:2px 6px;border-radius:3px;'
-        r'font-size:0.9em;font-family:Consolas,Monaco,monospace;">\1</code>',
-        html,
-    )
+    html = _CODE_BLOCK_RE.sub(_CODE_BLOCK_HTML, html)
+    html = _INLINE_CODE_RE.sub(_INLINE_CODE_HTML, html)
 
-    # Headers — white text on dark background for dark-mode resilience
-    html = re.sub(
-        r"^### (.+)$",
-        r'<h3 style="font-size:16px;font-weight:700;color:#ffffff;margin:24px 0 8px 0;'
-        r'padding:8px 12px;background:#1a1a2e;border-radius:4px;line-height:1.3;">\1</h3>',
-        html,
-        flags=re.MULTILINE,
-    )
-    html = re.sub(
-        r"^## (.+)$",
-        r'<h2 style="font-size:20px;font-weight:700;color:#ffffff;margin:32px 0 12px 0;'
-        r'padding:10px 14px;background:linear-gradient(135deg,#1a1a2e,#0f3460);border-radius:6px;line-height:1.3;">\1</h2>',
-        html,
-        flags=re.MULTILINE,
-    )
-    html = re.sub(
-        r"^# (.+)$",
-        r'<h1 style="font-size:26px;font-weight:800;color:#ffffff;margin:0 0 16px 0;'
-        r'padding:12px 16px;background:linear-gradient(135deg,#1a1a2e,#0f3460);border-radius:8px;line-height:1.2;">\1</h1>',
-        html,
-        flags=re.MULTILINE,
-    )
+    html = _HEADER_RE.sub(_header_html, html)
 
     # Bold and italic
-    html = re.sub(r"\*\*\*(.+?)\*\*\*", r"<strong><em>\1</em></strong>", html)
-    html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
-    html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
+    html = _BOLD_ITALIC_RE.sub(r"<strong><em>\1</em></strong>", html)
+    html = _BOLD_RE.sub(r"<strong>\1</strong>", html)
+    html = _ITALIC_RE.sub(r"<em>\1</em>", html)
 
     # Links [text](url) — styled as inline citations / source links
-    html = re.sub(
-        r"\[([^\]]+)\]\(([^)]+)\)",
-        r'<a href="\2" style="color:#4361ee;text-decoration:none;'
-        r'border-bottom:1px solid #4361ee40;">\1</a>',
-        html,
-    )
-
-    # Unordered list items
-    html = re.sub(
-        r"^[*\-] (.+)$",
-        r'<li style="margin-bottom:6px;line-height:1.6;">\1</li>',
-        html,
-        flags=re.MULTILINE,
-    )
+    html = _LINK_RE.sub(_LINK_HTML, html)
 
-    # Wrap consecutive <li> in <ul>
-    html = re.sub(
-        r"((?:<li[^>]*>.*?</li>\s*)+)",
-        r'<ul style="padding-left:20px;margin:12px 0;">\1</ul>',
-        html,
-        flags=re.DOTALL,
-    )
-
-    # Horizontal rules — styled divider
-    html = re.sub(
-        r"^---+$",
-        '<hr style="border:none;border-top:1px solid #e0e0e0;margin:28px 0;">',
-        html,
-        flags=re.MULTILINE,
-    )
-    html = re.sub(
-        r"^===+$",
-        '<hr style="border:none;border-top:1px solid #e0e0e0;margin:28px 0;">',
-        html,
-        flags=re.MULTILINE,
-    )
+    # Unordered list items, then wrap consecutive <li> in <ul>
+    html = _LIST_ITEM_RE.sub(_LIST_ITEM_HTML, html)
+    html = _LIST_RUN_RE.sub(_LIST_HTML, html)
 
-    # Paragraphs: double newlines become paragraph breaks
-    html = re.sub(r"\n\n+", "</p><p>", html)
-    # Single newlines to line breaks
-    html = html.replace("\n", "<br>\n")
+    # Horizontal rules (--- or ===) — styled divider
+    html = _RULE_RE.sub(_RULE_HTML, html)
 
-    # Wrap in paragraph tags
-    html = "<p>" + html + "</p>"
+    # Paragraphs: double newlines split paragraphs, single newlines become
+    # line breaks.  Paragraphs of bare spaces are dropped (one holding a
+    # newline keeps its <br>).  Built in one pass and joined once rather
+    # than rewriting the whole document for each step.
+    parts = []
+    for paragraph in _PARAGRAPH_BREAK_RE.split(html):
+        if paragraph and (not paragraph.isspace() or "\n" in paragraph):
+            parts.append(_PARAGRAPH_HTML)
+            parts.append(paragraph.replace("\n", "<br>\n"))
+            parts.append("</p>")
 
-    # Clean up empty paragraphs
-    html = re.sub(r"<p>\s*</p>", "", html)
-
-    # Style all paragraphs
-    html = html.replace("<p>", '<p style="margin:0 0 14px 0;line-height:1.7;color:#2d2d2d;">')
-
-    return html
+    return "".join(parts)
 
 
 def build_newsletter_html(subject: str, markdown_body: str) -> str:
@@ -232,6 +223,32 @@ def build_newsletter_html(subject: str, markdown_body: str) -> str:
     )
 
 
+# Bytes read per attachment chunk: a multiple of 57 so every chunk encodes
+# to whole 76-character base64 lines, exactly as a one-shot encode would.
+_ATTACHMENT_CHUNK = 57 * 16384
+
+
+def _mark_base64(part: MIMEApplication) -> None:
+    part["Content-Transfer-Encoding"] = "base64"
+
+
+def _file_attachment(path: Path, subtype: str) -> MIMEApplication:
+    """
+    Builds a base64 application/* attachment from a file.
+
+    The file is encoded chunk by chunk, so the raw bytes are never held
+    whole; the stock encoder would keep the raw file, a list of per-line
+    pieces and two full copies of the encoded text alive at once.
+    """
+    encoded = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_ATTACHMENT_CHUNK), b""):
+            encoded.append(base64.encodebytes(chunk).decode("ascii"))
+    part = MIMEApplication("".join(encoded), _subtype=subtype, _encoder=_mark_base64)
+    part.add_header("Content-Disposition", "attachment", filename=path.name)
+    return part
+
+
 def _build_email_message(
     recipients: List[str],
     subject: str,
@@ -278,25 +295,13 @@ def _build_email_message(
 
     # Attach PDF if provided
     if pdf_path and pdf_path.exists():
-        with open(pdf_path, "rb") as f:
-            pdf_data = f.read()
-        pdf_attachment = MIMEApplication(pdf_data, _subtype="pdf")
-        pdf_attachment.add_header(
-            "Content-Disposition", "attachment", filename=pdf_path.name
-        )
-        msg.attach(pdf_attachment)
+        msg.attach(_file_attachment(pdf_path, "pdf"))
 
     # Attach audio file if provided
     if audio_path and audio_path.exists():
         content_type = mimetypes.guess_type(str(audio_path))[0] or "audio/mpeg"
         maintype, subtype = content_type.split("/", 1)
-        with open(audio_path, "rb") as f:
-            audio_data = f.read()
-        attachment = MIMEApplication(audio_data, _subtype=subtype)
-        attachment.add_header(
-            "Content-Disposition", "attachment", filename=audio_path.name
-        )
-        msg.attach(attachment)
+        msg.attach(_file_attachment(audio_path, subtype))
 
     return msg
 
@@ -310,6 +315,38 @@ def parse_recipients(recipient_str: str) -> List[str]:
     return [addr.strip() for addr in recipient_str.split(",") if addr.strip()]
 
 
+@contextmanager
+def smtp_session(config: Dict[str, Any]) -> Iterator[smtplib.SMTP]:
+    """
+    Opens one authenticated SMTP connection for any number of sends.
+
+    Connects, upgrades with STARTTLS when SMTP_USE_TLS is set (the default)
+    and logs in once; the connection is closed when the block exits.
+    Pass the yielded server to send_report_email(session=...) to skip the
+    per-message TCP + TLS + AUTH round trips.
+
+    Raises:
+        ValueError: If SMTP config is incomplete.
+        smtplib.SMTPException: If connecting or logging in fails.
+    """
+    validation_error = validate_smtp_config(config)
+    if validation_error:
+        raise ValueError(validation_error)
+
+    host = config["SMTP_HOST"]
+    port = int(config.get("SMTP_PORT", 587))
+    use_tls = str(config.get("SMTP_USE_TLS", "true")).lower() in ("true", "1", "yes")
+
+    server = smtplib.SMTP(host, port)
+    try:
+        if use_tls:
+            server.starttls()
+        server.login(config["SMTP_USER"], config["SMTP_PASSWORD"])
+        yield server
+    finally:
+        server.quit()
+
+
 def send_report_email(
     recipient: str,
     subject: str,
@@ -318,10 +355,13 @@ def send_report_email(
     job_id: Optional[str] = None,
     audio_path: Optional[Path] = None,
     pdf_path: Optional[Path] = None,
+    session: Optional[smtplib.SMTP] = None,
 ) -> None:
     """
     Sends a research report email via SMTP.
 
+    All recipients share a single message and a single SMTP transaction.
+
     Args:
         recipient: One or more email addresses, comma-separated.
         subject: Email subject line.
@@ -330,6 +370,8 @@ def send_report_email(
         job_id: Optional job ID for the unsubscribe footer.
         audio_path: Optional path to an MP3 file to attach.
         pdf_path: Optional path to a PDF file to attach.
+        session: Optional open server from smtp_session(); when omitted a
+            connection is opened and closed for this message alone.
 
     Raises:
         ValueError: If SMTP config is incomplete.
@@ -339,29 +381,16 @@ def send_report_email(
     if validation_error:
         raise ValueError(validation_error)
 
-    host = config["SMTP_HOST"]
-    port = int(config.get("SMTP_PORT", 587))
-    user = config["SMTP_USER"]
-    password = config["SMTP_PASSWORD"]
-    sender = config.get("SMTP_FROM") or user
-    use_tls = str(config.get("SMTP_USE_TLS", "true")).lower() in ("true", "1", "yes")
-
+    sender = config.get("SMTP_FROM") or config["SMTP_USER"]
     recipients = parse_recipients(recipient)
 
     msg = _build_email_message(
         recipients, subject, markdown_body, sender, job_id, audio_path, pdf_path
     )
 
-    if use_tls:
-        server = smtplib.SMTP(host, port)
-        server.starttls()
-    else:
-        server = smtplib.SMTP(host, port)
-
-    try:
-        server.login(user, password)
-        server.sendmail(sender, recipients, msg.as_string())
-    finally:
-        server.quit()
-
+    if session is not None:
+        session.send_message(msg, from_addr=sender, to_addrs=recipients)
+        return
 
+    with smtp_session(config) as server:
+        server.send_message(msg, from_addr=sender, to_addrs=recipients)
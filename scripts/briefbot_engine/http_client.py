@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import functools
+import http.client
+import io
 import json
 import os
 import random
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Union
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
 
 DEFAULT_TIMEOUT_SECONDS = 26
 DEFAULT_ATTEMPTS = 3
@@ -19,12 +28,13 @@ USER_AGENT = "briefbot-http/2026.2"
 DEBUG = False
 
 
-def _debug_enabled() -> bool:
+def debug_enabled() -> bool:
+    """Return True when --debug or BRIEFBOT_DEBUG asked for verbose output."""
     return DEBUG or os.environ.get("BRIEFBOT_DEBUG", "").lower() in ("1", "true", "yes", "on")
 
 
 def _debug(msg: str) -> None:
-    if _debug_enabled():
+    if debug_enabled():
         sys.stderr.write(f"[HTTP] {msg}\n")
         sys.stderr.flush()
 
@@ -64,12 +74,19 @@ def _retryable(code: int) -> bool:
     return code in (408, 425, 429, 500, 502, 503, 504, 522, 524) or code >= 520
 
 
-def _decode_json(payload: str) -> Dict[str, Any]:
+def _loads(payload: Union[str, bytes]) -> Any:
+    """Decode JSON with orjson when installed, else the stdlib parser."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _decode_json(payload: Union[str, bytes]) -> Dict[str, Any]:
     if not payload:
         return {}
     try:
-        parsed = json.loads(payload)
-    except json.JSONDecodeError as exc:
+        parsed = _loads(payload)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise TransportError(f"Malformed JSON payload: {exc}") from exc
     if isinstance(parsed, dict):
         return parsed
@@ -79,6 +96,8 @@ def _decode_json(payload: str) -> Dict[str, Any]:
 def _prepare_payload(json_body: Optional[Mapping[str, Any]]) -> Optional[bytes]:
     if json_body is None:
         return None
+    if orjson is not None:
+        return orjson.dumps(dict(json_body), option=orjson.OPT_NON_STR_KEYS)
     return json.dumps(dict(json_body), ensure_ascii=False).encode("utf-8")
 
 
@@ -91,6 +110,143 @@ def _build_request(url: str, method: str, headers: Optional[Mapping[str, str]],
     return urllib.request.Request(url, data=payload, headers=combined, method=method.upper())
 
 
+def _status_error(exc: urllib.error.HTTPError, url: str) -> TransportError:
+    body = ""
+    try:
+        body = exc.read().decode("utf-8")
+    except Exception:
+        body = ""
+    return TransportError(f"Status {exc.code} {exc.reason}", exc.code, body or None, url)
+
+
+# One keep-alive connection per (scheme, host) and worker thread, so repeat
+# calls to the same API skip the TCP and TLS handshakes.
+_POOL = threading.local()
+MAX_REDIRECTS = 5
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class _PooledResponse:
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+    proxies = urllib.request.getproxies()
+    return parts.scheme in proxies and not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _pooled_connection(parts: urllib.parse.SplitResult, timeout: float) -> http.client.HTTPConnection:
+    connections = getattr(_POOL, "connections", None)
+    if connections is None:
+        connections = _POOL.connections = {}
+    conn = connections.get((parts.scheme, parts.netloc))
+    if conn is None:
+        factory = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = factory(parts.netloc, timeout=timeout)
+        connections[(parts.scheme, parts.netloc)] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def close_pool() -> None:
+    """Close every keep-alive connection pooled by the calling thread."""
+    connections = getattr(_POOL, "connections", None) or {}
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
+def releases_pool(func):
+    """Close the calling thread's pooled connections when *func* returns.
+
+    For tasks run on executor worker threads: the pool is thread-local, so
+    nothing else would close those sockets before the worker goes away.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_pool()
+
+    return wrapper
+
+
+def _discard_connection(parts: urllib.parse.SplitResult) -> None:
+    conn = getattr(_POOL, "connections", {}).pop((parts.scheme, parts.netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _open(req: urllib.request.Request, timeout: float, redirects: int = MAX_REDIRECTS):
+    """Drop-in for urlopen() that reuses a pooled keep-alive connection.
+
+    Proxied URLs go through urllib so its proxy handlers apply. GET/HEAD
+    redirects are followed to their Location; any other 3xx is raised
+    rather than re-sent, so a POST is never submitted twice.
+    """
+    parts = urllib.parse.urlsplit(req.full_url)
+    if parts.scheme not in ("http", "https") or _uses_proxy(parts):
+        return urllib.request.urlopen(req, timeout=timeout)
+
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    headers = dict(req.header_items())
+
+    for attempt in range(2):
+        conn = _pooled_connection(parts, timeout)
+        reused = conn.sock is not None
+        try:
+            conn.request(req.get_method(), path, body=req.data, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except _STALE_CONNECTION_ERRORS:
+            _discard_connection(parts)
+            if reused and attempt == 0:
+                continue
+            raise
+        except http.client.HTTPException as exc:
+            _discard_connection(parts)
+            raise ConnectionError(f"{type(exc).__name__}: {exc}") from exc
+        except Exception:
+            _discard_connection(parts)
+            raise
+        if response.will_close:
+            _discard_connection(parts)
+        break
+
+    location = response.getheader("Location")
+    if 300 <= response.status < 400 and location and redirects > 0 and req.get_method() in ("GET", "HEAD"):
+        target = urllib.parse.urljoin(req.full_url, location)
+        follow = urllib.request.Request(target, headers=dict(req.header_items()), method=req.get_method())
+        return _open(follow, timeout, redirects - 1)
+    if response.status >= 300:
+        raise urllib.error.HTTPError(
+            req.full_url, response.status, response.reason, response.headers, io.BytesIO(body)
+        )
+    return _PooledResponse(response.status, body)
+
+
 class JsonSession:
     """Minimal JSON HTTP client with retry handling."""
 
@@ -113,17 +269,12 @@ class JsonSession:
                 time.sleep(delay)
             req = _build_request(url, method, headers, payload)
             try:
-                with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                    raw = response.read().decode("utf-8")
+                with _open(req, self.timeout) as response:
+                    raw = response.read()
                     _debug(f"{method.upper()} {url} -> {response.status} ({len(raw)} bytes)")
                     return _decode_json(raw)
             except urllib.error.HTTPError as exc:
-                body = ""
-                try:
-                    body = exc.read().decode("utf-8")
-                except Exception:
-                    body = ""
-                last_error = TransportError(f"Status {exc.code} {exc.reason}", exc.code, body or None, url)
+                last_error = _status_error(exc, url)
                 _debug(f"{method.upper()} {url} -> HTTP {exc.code}")
                 if not _retryable(exc.code):
                     raise last_error
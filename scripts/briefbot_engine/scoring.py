@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import functools
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import date
 from typing import Iterable, List, Optional
 
 from . import timeframe
@@ -26,6 +29,8 @@ MISSING_INTERACTION_PENALTY = 7
 WEB_SOURCE_PENALTY = 6
 WEB_DATE_BONUS = 5
 WEB_DATE_PENALTY = 9
+CONTAINMENT_SIMILARITY = 0.92
+SIGNATURE_MAX_BYTES = 256
 
 SOURCE_TRUST_BASE = {
     Channel.REDDIT: 61,
@@ -92,12 +97,19 @@ def rank_items(items: List[Signal], source_weights: Optional[dict] = None) -> Li
 def _apply_source_weights(items: List[Signal], source_weights: dict) -> None:
     if not items or not source_weights:
         return
+    channel_weights = {}
+    for channel in Channel:
+        weight = float(source_weights.get(channel.value, 1.0))
+        if weight != 1.0:
+            channel_weights[channel] = weight
+    if not channel_weights:
+        return
     for item in items:
-        weight = float(source_weights.get(item.channel.value, 1.0))
-        if weight == 1.0:
+        weight = channel_weights.get(item.channel)
+        if weight is None:
             continue
-        adjusted = max(0, min(100, round(item.rank * weight)))
-        item.rank = adjusted
+        adjusted = round(item.rank * weight)
+        item.rank = 0 if adjusted < 0 else 100 if adjusted > 100 else adjusted
         item.extras["stance_weight"] = weight
 
 
@@ -105,15 +117,21 @@ def _score_platform_items(items: List[Signal]) -> None:
     if not items:
         return
 
-    raw_topical = [item.topicality * 100 for item in items]
-    raw_fresh = [timeframe.recency_score(item.dated) for item in items]
-    raw_interaction = [
-        item.interaction.pulse if item.interaction else None for item in items
-    ]
-    raw_trust = [_trust(item) for item in items]
-
-    pct_topical = _percentile_ranks([float(v) for v in raw_topical])
-    pct_fresh = _percentile_ranks([float(v) for v in raw_fresh])
+    n = len(items)
+    raw_topical: List[float] = [0.0] * n
+    raw_fresh: List[float] = [0.0] * n
+    raw_interaction: List[Optional[float]] = [None] * n
+    raw_trust: List[int] = [0] * n
+    today = timeframe.today_utc()
+    for idx, item in enumerate(items):
+        raw_topical[idx] = float(item.topicality * 100)
+        raw_fresh[idx] = float(timeframe.recency_score(item.dated, today=today))
+        if item.interaction:
+            raw_interaction[idx] = item.interaction.pulse
+        raw_trust[idx] = _trust(item)
+
+    pct_topical = _percentile_ranks(raw_topical)
+    pct_fresh = _percentile_ranks(raw_fresh)
     pct_interaction = _percentile_ranks(raw_interaction, fallback=MISSING_INTERACTION_FALLBACK)
 
     weights = [
@@ -151,9 +169,10 @@ def _score_web_items(items: List[Signal]) -> None:
     if not items:
         return
 
+    today = timeframe.today_utc()
     for item in items:
         topical = int(item.topicality * 100)
-        fresh = timeframe.recency_score(item.dated)
+        fresh = timeframe.recency_score(item.dated, today=today)
         trust = _trust(item)
 
         item.scorecard = Scorecard(
@@ -187,7 +206,7 @@ def _sort_by_score(items: List[Signal]) -> List[Signal]:
         if not value:
             return -1
         try:
-            return datetime.strptime(value, "%Y-%m-%d").date().toordinal()
+            return date.fromisoformat(value).toordinal()
         except ValueError:
             return -1
 
@@ -199,15 +218,25 @@ def _sort_by_score(items: List[Signal]) -> List[Signal]:
     return sorted(items, key=sort_key)
 
 
-def _tokenize(text: str) -> List[str]:
-    import re
+# Every byte outside a-z and 0-9 maps to a space, so splitting the lowered,
+# ASCII-encoded text yields exactly the old [a-z0-9]+ tokens.
+_SIGNATURE_BYTES = bytes(
+    byte if 48 <= byte <= 57 or 97 <= byte <= 122 else 32 for byte in range(256)
+)
 
-    return re.findall(r"[a-z0-9]+", (text or "").lower())
 
+@functools.lru_cache(maxsize=4096)
+def _squash(text: str) -> bytes:
+    """Reduce text to a capped ASCII signature for similarity checks.
 
-def _squash(text: str) -> str:
-    tokens = _tokenize(text)
-    return " ".join(tokens)
+    Works on bytes throughout: non-ASCII characters encode to "?" (one
+    separator each, as the regex tokenizer treated them), and a C-level
+    translate + split replaces the regex scan and per-token str objects.
+    Memoized on the text, so cross-posted items and repeat passes over
+    the same items reuse their signature.
+    """
+    raw = (text or "").lower().encode("ascii", "replace").translate(_SIGNATURE_BYTES)
+    return b" ".join(raw.split())[:SIGNATURE_MAX_BYTES]
 
 
 def _url_key(url: str) -> str:
@@ -221,17 +250,95 @@ def _url_key(url: str) -> str:
     return lowered.rstrip("/")
 
 
-def _soft_similarity(text_a: str, text_b: str) -> float:
+def _matcher_for(text_b: bytes):
+    """A SequenceMatcher with *text_b* as its indexed second sequence.
+
+    SequenceMatcher builds its b2j index for seq2 only, so one matcher per
+    item can be compared against any number of seq1 values via set_seq1.
+    """
     from difflib import SequenceMatcher
 
+    return SequenceMatcher(None, b"", text_b, autojunk=False)
+
+
+def _soft_similarity(text_a: bytes, text_b: bytes, matcher=None) -> float:
+    """Similarity of two signatures; *matcher* may be a reusable _matcher_for(text_b)."""
     if not text_a or not text_b:
         return 0.0
-    ratio = SequenceMatcher(None, text_a, text_b).ratio()
+    if matcher is None:
+        matcher = _matcher_for(text_b)
+    matcher.set_seq1(text_a)
+    ratio = matcher.ratio()
     if text_a in text_b or text_b in text_a:
-        ratio = max(ratio, 0.92)
+        ratio = max(ratio, CONTAINMENT_SIMILARITY)
     return ratio
 
 
+def _length_bound(len_a: int, len_b: int) -> float:
+    """Upper bound on SequenceMatcher.ratio() given only the two lengths."""
+    total = len_a + len_b
+    if total == 0:
+        return 0.0
+    return 2.0 * min(len_a, len_b) / total
+
+
+def _overlap_bound(counts_a: Counter, counts_b: Counter, total: int) -> float:
+    """Upper bound on SequenceMatcher.ratio() from per-byte counts alone.
+
+    Matching blocks can only pair up bytes both signatures contain, so
+    ``2 * shared / total`` (difflib's quick_ratio) caps the real ratio.
+    """
+    if total == 0:
+        return 0.0
+    if len(counts_a) > len(counts_b):
+        counts_a, counts_b = counts_b, counts_a
+    shared = 0
+    for byte, count in counts_a.items():
+        other = counts_b.get(byte)
+        if other:
+            shared += count if count < other else other
+    return 2.0 * shared / total
+
+
+def _contains_either(text_a: bytes, text_b: bytes) -> bool:
+    if not text_a or not text_b:
+        return False
+    return text_a in text_b or text_b in text_a
+
+
+def _length_window_candidates(
+    lengths: List[int],
+    url_keys: List[str],
+    threshold: float,
+) -> List[List[int]]:
+    """Per index, the later indices a strict-threshold pass must compare.
+
+    Without containment matches a pair needs ``_length_bound >= threshold``
+    or a shared URL, so each item only faces items whose length lies in
+    ``[len * t / (2 - t), len * (2 - t) / t]`` plus its URL twins. Lists
+    are ascending, preserving the original left-to-right visiting order.
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    sorted_lengths = [lengths[idx] for idx in order]
+    url_groups: dict = {}
+    for idx, key in enumerate(url_keys):
+        if key:
+            url_groups.setdefault(key, []).append(idx)
+
+    low_factor = threshold / (2.0 - threshold)
+    high_factor = (2.0 - threshold) / threshold
+    candidates = []
+    for left, length in enumerate(lengths):
+        # The epsilon only widens the window; the loop re-checks the bound.
+        lo = bisect_left(sorted_lengths, length * low_factor - 1e-9)
+        hi = bisect_right(sorted_lengths, length * high_factor + 1e-9)
+        rights = {idx for idx in order[lo:hi] if idx > left}
+        if url_keys[left]:
+            rights.update(idx for idx in url_groups[url_keys[left]] if idx > left)
+        candidates.append(sorted(rights))
+    return candidates
+
+
 def _text_of(item: Signal) -> str:
     """Extract the primary text field from a signal."""
     return " ".join([item.headline or "", item.byline or "", item.blurb or ""]).strip()
@@ -250,34 +357,74 @@ def deduplicate(
         for item in items
     ]
     url_keys = [_url_key(item.url) for item in items]
-    discarded_indices = set()
+    lengths = [len(signature) for signature in signatures]
+    # Per-item byte histograms: a cheap signature whose overlap bounds the
+    # real ratio, so SequenceMatcher only runs on pairs that could match.
+    byte_counts = [Counter(signature) for signature in signatures]
+    # Built lazily and kept per item, so each signature is indexed once
+    # rather than once for every pair it is compared in.
+    matchers: List[Optional[object]] = [None] * len(items)
+    # Pairs whose length ratio or byte overlap already rules out the
+    # threshold can only match through containment, which is itself only
+    # enough at lenient thresholds.
+    containment_matches = CONTAINMENT_SIMILARITY >= similarity_threshold
+    # Strict thresholds make length decisive, so each item only walks the
+    # items in its length window instead of every later item.
+    windows = (
+        None
+        if containment_matches
+        else _length_window_candidates(lengths, url_keys, similarity_threshold)
+    )
+    discarded = bytearray(len(items))
     for left in range(len(items)):
-        if left in discarded_indices:
+        if discarded[left]:
             continue
-        for right in range(left + 1, len(items)):
-            if right in discarded_indices:
+        rights = range(left + 1, len(items)) if windows is None else windows[left]
+        for right in rights:
+            if discarded[right]:
                 continue
             if url_keys[left] and url_keys[left] == url_keys[right]:
                 match_score = 1.0
+            elif (
+                _length_bound(lengths[left], lengths[right]) < similarity_threshold
+                or _overlap_bound(
+                    byte_counts[left],
+                    byte_counts[right],
+                    lengths[left] + lengths[right],
+                )
+                < similarity_threshold
+            ):
+                if not containment_matches:
+                    continue
+                if not _contains_either(signatures[left], signatures[right]):
+                    continue
+                match_score = CONTAINMENT_SIMILARITY
             else:
-                match_score = _soft_similarity(signatures[left], signatures[right])
+                matcher = matchers[right]
+                if matcher is None:
+                    matcher = matchers[right] = _matcher_for(signatures[right])
+                match_score = _soft_similarity(signatures[left], signatures[right], matcher)
             if match_score >= similarity_threshold:
                 if items[left].rank >= items[right].rank:
-                    discarded_indices.add(right)
+                    discarded[right] = 1
                 else:
-                    discarded_indices.add(left)
+                    discarded[left] = 1
                     break
-    return [item for idx, item in enumerate(items) if idx not in discarded_indices]
+    return [item for idx, item in enumerate(items) if not discarded[idx]]
 
 
 def jaccard_similarity(a: Iterable[str], b: Iterable[str]) -> float:
-    set_a = set(a)
-    set_b = set(b)
-    if not set_a and not set_b:
-        return 1.0
-    if not set_a or not set_b:
-        return 0.0
-    return len(set_a & set_b) / len(set_a | set_b)
+    set_a = a if isinstance(a, (set, frozenset)) else set(a)
+    set_b = b if isinstance(b, (set, frozenset)) else set(b)
+    if len(set_a) > len(set_b):
+        set_a, set_b = set_b, set_a
+    # Intersect the smaller into the larger and derive the union by
+    # inclusion-exclusion instead of building a third set.
+    shared = len(set_a.intersection(set_b))
+    union = len(set_a) + len(set_b) - shared
+    # Two empty inputs are identical; one empty input needs no special case,
+    # as its intersection is empty against a non-empty union.
+    return shared / union if union else 1.0
 
 
 dedupe_items = deduplicate
@@ -4,12 +4,19 @@ import hashlib
 import json
 import os
 import sys
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from .. import http_client
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
+
 
 def _log(message: str):
     """Emit a debug log line to stderr, gated by BRIEFBOT_DEBUG."""
@@ -18,6 +25,23 @@ def _log(message: str):
         sys.stderr.flush()
 
 
+def _loads(payload: bytes) -> Any:
+    """Decode a cache file's bytes with orjson when installed, else stdlib json."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode *data* for a cache file; both paths write compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError, OSError)
+
+
 class ProviderRegistry:
     """Manages response caching (JSON files with TTL) and model selection."""
 
@@ -44,6 +68,8 @@ class ProviderRegistry:
 
     def __init__(self):
         self._model_file = self.CACHE_DIR / "model_prefs.json"
+        self._prefs_cache: dict = {}
+        self._prefs_stamp: Optional[Tuple[int, int]] = None
 
     # -----------------------------------------------------------------
     # Response caching
@@ -53,68 +79,105 @@ class ProviderRegistry:
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     def cache_key(self, topic: str, start: str, end: str, platform: str) -> str:
-        payload = {
-            "topic": (topic or "").strip().lower(),
-            "start": start,
-            "end": end,
-            "channel": platform,
-        }
-        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
-        return digest[:18]
+        # Fields joined with the ASCII unit separator, which cannot occur in
+        # a typed topic, so distinct tuples never share a key string.
+        raw = "\x1f".join(((topic or "").strip().lower(), start, end, platform))
+        # A 9-byte BLAKE2b digest gives the same 18 hex chars as the old
+        # truncated SHA-256 without hashing (and discarding) 32 bytes.
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=9).hexdigest()
 
     def cache_path(self, key: str) -> Path:
         return self.CACHE_DIR / f"{key}.json"
 
-    def is_valid(self, filepath: Path, ttl_hours: int = None) -> bool:
+    def is_valid(
+        self, filepath: Path, ttl_hours: int = None, now: Optional[float] = None
+    ) -> bool:
+        """True when *filepath* exists and is younger than the TTL.
+
+        Batch callers may pass *now* (``time.time()`` seconds) once for many
+        checks; ages are plain float arithmetic on st_mtime either way.
+        """
         ttl = self.DEFAULT_TTL if ttl_hours is None else ttl_hours
-        if not filepath.exists():
-            return False
+        hours = self.age_hours(filepath, now)
+        return hours is not None and hours < ttl
+
+    @staticmethod
+    def _read_fresh(filepath: Path, ttl: float) -> Tuple[Optional[bytes], Optional[float]]:
+        """Return ``(raw_bytes, age_hours)`` if *filepath* is younger than *ttl*.
+
+        One open, one fstat (serving both the TTL check and the read size)
+        and one unbuffered read; ``(None, None)`` when missing or stale.
+        """
         try:
-            mtime = datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc)
-            elapsed = (datetime.now(timezone.utc) - mtime).total_seconds() / 3600
-            return elapsed < ttl
+            fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
         except OSError:
-            return False
+            return None, None
+        try:
+            st = os.fstat(fd)
+            hours = (time.time() - st.st_mtime) / 3600
+            if hours >= ttl:
+                return None, None
+            return os.read(fd, st.st_size), hours
+        except OSError:
+            return None, None
+        finally:
+            os.close(fd)
 
     def load(self, key: str, ttl_hours: int = None) -> Optional[dict]:
-        ttl = self.DEFAULT_TTL if ttl_hours is None else ttl_hours
-        fp = self.cache_path(key)
-        if not self.is_valid(fp, ttl):
-            return None
-        try:
-            with open(fp, "r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except (json.JSONDecodeError, OSError):
-            return None
+        return self.load_with_age(key, ttl_hours)[0]
 
-    def age_hours(self, filepath: Path) -> Optional[float]:
-        if not filepath.exists():
-            return None
+    def age_hours(self, filepath: Path, now: Optional[float] = None) -> Optional[float]:
         try:
-            mtime = datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc)
-            return (datetime.now(timezone.utc) - mtime).total_seconds() / 3600
+            mtime = os.stat(filepath).st_mtime
         except OSError:
             return None
+        return ((time.time() if now is None else now) - mtime) / 3600
 
     def load_with_age(self, key: str, ttl_hours: int = None) -> tuple:
         ttl = self.DEFAULT_TTL if ttl_hours is None else ttl_hours
-        fp = self.cache_path(key)
-        if not self.is_valid(fp, ttl):
+        raw, hours = self._read_fresh(self.cache_path(key), ttl)
+        if raw is None:
             return None, None
-        hours = self.age_hours(fp)
         try:
-            with open(fp, "r", encoding="utf-8") as handle:
-                return json.load(handle), hours
-        except (json.JSONDecodeError, OSError):
+            return _loads(raw), hours
+        except _DECODE_ERRORS:
             return None, None
 
+    @staticmethod
+    def _write_atomic(filepath: Path, payload: bytes):
+        """Write *payload* to a private temp sibling, then rename it into place.
+
+        Readers see either the old file or the complete new one, never a
+        truncated half-write; concurrent writers (search threads, parallel
+        runs) each use their own temp name.
+        """
+        tmp = filepath.with_name(
+            f"{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        fd = os.open(
+            tmp,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        try:
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp, filepath)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
     def save(self, key: str, data: dict):
         self._ensure_dir()
-        fp = self.cache_path(key)
         try:
-            with open(fp, "w", encoding="utf-8") as handle:
-                json.dump(data, handle)
+            self._write_atomic(self.cache_path(key), _dumps(data))
         except OSError:
             pass
 
@@ -146,23 +209,48 @@ class ProviderRegistry:
     # Model preference persistence
     # -----------------------------------------------------------------
 
+    @staticmethod
+    def _file_stamp(filepath: Path) -> Optional[Tuple[int, int, float]]:
+        """``(mtime_ns, size, mtime)`` for *filepath*, or None when missing."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_mtime
+
     def _load_model_prefs(self) -> dict:
-        ttl_hours = self.MODEL_TTL_DAYS * 24
-        if not self.is_valid(self._model_file, ttl_hours):
+        # The prefs file is re-read only when its mtime/size change; within a
+        # process, repeated lookups are served from the parsed copy.
+        ttl = self.MODEL_TTL_DAYS * 24
+        stamp = self._file_stamp(self._model_file)
+        if stamp is None:
             return {}
-        try:
-            with open(self._model_file, "r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except (json.JSONDecodeError, OSError):
+        if (time.time() - stamp[2]) / 3600 >= ttl:
             return {}
+        if stamp[:2] != self._prefs_stamp:
+            raw, _ = self._read_fresh(self._model_file, ttl)
+            if raw is None:
+                return {}
+            try:
+                prefs = _loads(raw)
+            except _DECODE_ERRORS:
+                return {}
+            self._prefs_cache = prefs if isinstance(prefs, dict) else {}
+            self._prefs_stamp = stamp[:2]
+        # A copy, so callers that edit the result before saving never
+        # change the cached state behind the file's back.
+        return dict(self._prefs_cache)
 
     def _save_model_prefs(self, data: dict):
         self._ensure_dir()
         try:
-            with open(self._model_file, "w", encoding="utf-8") as handle:
-                json.dump(data, handle)
+            self._write_atomic(self._model_file, _dumps(data))
         except OSError:
-            pass
+            return
+        stamp = self._file_stamp(self._model_file)
+        if stamp is not None:
+            self._prefs_cache = dict(data)
+            self._prefs_stamp = stamp[:2]
 
     def get_cached_model(self, provider_name: str) -> Optional[str]:
         return self._load_model_prefs().get(provider_name)
@@ -0,0 +1,52 @@
+"""Field and error helpers shared by the OpenAI web-search sources."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Tuple
+
+from .. import http_client
+
+# Literal substrings; "model <name> not found" is checked in is_access_error.
+ACCESS_TOKENS = (
+    "organization must be verified",
+    "does not have access",
+    "access denied",
+    "not available for your account",
+)
+ACCESS_STATUS_CODES = frozenset({400, 401, 403, 404, 429})
+
+
+def is_access_error(err: http_client.HTTPError, extra_tokens: Tuple[str, ...] = ()) -> bool:
+    """True when *err* says this key may not use the requested model."""
+    if err.status_code not in ACCESS_STATUS_CODES or not err.body:
+        return False
+    text = err.body.lower()
+    if any(token in text for token in ACCESS_TOKENS) or any(token in text for token in extra_tokens):
+        return True
+    model_at = text.find("model ")
+    return model_at >= 0 and text.find("not found", model_at) > model_at
+
+
+def first(raw: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """Value of the first key in *keys* that is present and not None."""
+    for key in keys:
+        value = raw.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def text(value: Any) -> str:
+    """Stripped text for a field value, without re-converting strings."""
+    if isinstance(value, str):
+        return value.strip()
+    return "" if value is None else str(value).strip()
+
+
+def unit_score(value: Any) -> float:
+    """*value* as a float clamped to [0, 1]; 0.5 when it is not numeric."""
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return 0.5
+    return 0.0 if score < 0.0 else score if score <= 1.0 else 1.0
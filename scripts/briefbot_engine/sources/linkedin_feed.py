@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from .. import http_client
+from .. import http_client, timeframe
+from . import catalog, fields
 
 FALLBACK_MODELS = ["gpt-4o-mini", "gpt-4o"]
 
+# (api key, model) pairs that returned an access error during this process.
+_UNAVAILABLE_MODELS: Set[Tuple[str, str]] = set()
+
 
 def _err(msg: str) -> None:
     sys.stderr.write(f"[LinkedIn] {msg}\n")
@@ -22,20 +27,7 @@ def _info(msg: str) -> None:
     sys.stderr.flush()
 
 
-_ACCESS_PATTERNS = (
-    r"organization must be verified",
-    r"does not have access",
-    r"access denied",
-    r"model .*not found",
-    r"not available for your account",
-)
-
-
-def _is_access_err(err: http_client.HTTPError) -> bool:
-    if err.status_code not in (400, 401, 403, 404, 429) or not err.body:
-        return False
-    text = err.body.lower()
-    return any(re.search(pattern, text) for pattern in _ACCESS_PATTERNS)
+_is_access_err = fields.is_access_error
 
 
 API_URL = "https://api.openai.com/v1/responses"
@@ -75,32 +67,46 @@ Return JSON only:
 }}
 """
 
+_FILLER_RE = re.compile(r"\b(how to|best|top|guide|review|tutorial)\b")
+_TOK_RE = re.compile(r"[a-z0-9]+")
+_POSTS_ANCHOR = re.compile(r'\{\s*"posts"\s*:')
+_DECODER = json.JSONDecoder()
+
 
+@functools.lru_cache(maxsize=1024)
 def _trim_query(topic: str) -> str:
-    lowered = (topic or "").lower()
-    lowered = re.sub(r"\\b(how to|best|top|guide|review|tutorial)\\b", " ", lowered)
-    tokens = [tok for tok in re.findall(r"[a-z0-9]+", lowered) if len(tok) > 2]
-    seen = []
+    lowered = _FILLER_RE.sub(" ", (topic or "").lower())
+    tokens = [tok for tok in _TOK_RE.findall(lowered) if len(tok) > 2]
+    seen = set()
+    compact = []
     for tok in tokens:
         if tok in seen:
             continue
-        seen.append(tok)
-        if len(seen) >= 5:
+        seen.add(tok)
+        compact.append(tok)
+        if len(compact) >= 5:
             break
-    return " ".join(seen) or topic
+    return " ".join(compact) or topic
 
 
 def _extract_items(output_text: str) -> List[Dict[str, Any]]:
     if not output_text:
         return []
-    decoder = json.JSONDecoder()
+    anchor = _POSTS_ANCHOR.search(output_text)
+    if anchor:
+        try:
+            candidate, _ = _DECODER.raw_decode(output_text, anchor.start())
+        except json.JSONDecodeError:
+            candidate = None
+        if isinstance(candidate, dict) and isinstance(candidate.get("posts"), list):
+            return candidate["posts"]
     cursor = 0
     while True:
         start = output_text.find("{", cursor)
         if start < 0:
             return []
         try:
-            candidate, consumed = decoder.raw_decode(output_text[start:])
+            candidate, consumed = _DECODER.raw_decode(output_text[start:])
         except json.JSONDecodeError:
             cursor = start + 1
             continue
@@ -109,6 +115,28 @@ def _extract_items(output_text: str) -> List[Dict[str, Any]]:
         cursor = start + max(consumed, 1)
 
 
+@functools.lru_cache(maxsize=64)
+def _discovery_prompt(topic: str, start: str, end: str, sampling: str) -> Tuple[str, str]:
+    """Render the discovery prompt and query hint; repeat inputs reuse the rendered text."""
+    depth_spec = SAMPLING_SPECS.get(sampling, SAMPLING_SPECS["standard"])
+    query_hint = _trim_query(topic)
+    prompt = LINKEDIN_DISCOVERY_PROMPT.format(
+        topic=topic,
+        from_date=start,
+        to_date=end,
+        min_items=depth_spec["min"],
+        max_items=depth_spec["max"],
+        query_hint=query_hint,
+    )
+    return prompt, query_hint
+
+
+def _usable_models(key: str, candidates: List[str]) -> List[str]:
+    """Drop models this key was already refused, keeping the chain non-empty."""
+    usable = [candidate for candidate in candidates if (key, candidate) not in _UNAVAILABLE_MODELS]
+    return usable or candidates
+
+
 def search(
     key: str,
     model: str,
@@ -118,13 +146,17 @@ def search(
     sampling: str = "standard",
     mock_response: Optional[Dict] = None,
     _is_retry: bool = False,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     if mock_response is not None:
         return mock_response
 
-    depth_spec = SAMPLING_SPECS.get(sampling, SAMPLING_SPECS["standard"])
-    min_items = depth_spec["min"]
-    max_items = depth_spec["max"]
+    cache_id = catalog.cache_key(topic, start, end, f"linkedin:{sampling}:{model}")
+    if use_cache:
+        cached = catalog.load(cache_id)
+        if cached is not None:
+            _info("Using cached response")
+            return cached
 
     headers = {
         "Authorization": f"Bearer {key}",
@@ -138,16 +170,9 @@ def search(
     for candidate in FALLBACK_MODELS:
         if candidate not in models_chain:
             models_chain.append(candidate)
+    models_chain = _usable_models(key, models_chain)
 
-    query_hint = _trim_query(topic)
-    prompt = LINKEDIN_DISCOVERY_PROMPT.format(
-        topic=topic,
-        from_date=start,
-        to_date=end,
-        min_items=min_items,
-        max_items=max_items,
-        query_hint=query_hint,
-    )
+    prompt, query_hint = _discovery_prompt(topic, start, end, sampling)
 
     last_err = None
 
@@ -169,13 +194,17 @@ def search(
         }
 
         try:
-            return http_client.post(API_URL, payload, headers=headers, timeout=timeout)
+            response = http_client.post(API_URL, payload, headers=headers, timeout=timeout)
         except http_client.HTTPError as api_err:
             last_err = api_err
             if _is_access_err(api_err):
+                _UNAVAILABLE_MODELS.add((key, current_model))
                 _info(f"Model {current_model} not accessible, trying fallback...")
                 continue
             raise
+        if _worth_caching(response):
+            catalog.save(cache_id, response)
+        return response
 
     if last_err:
         _err(f"All models failed. Last error: {last_err}")
@@ -184,21 +213,16 @@ def search(
     raise http_client.HTTPError("No models available")
 
 
-def parse_linkedin_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]:
-    extracted: List[Dict[str, Any]] = []
+_URL_KEYS = ("url", "link")
+_SIGNAL_KEYS = ("signals", "metrics")
+_SNIPPET_KEYS = ("snippet", "excerpt")
+_DATE_KEYS = ("dated", "posted")
+_RATIONALE_KEYS = ("rationale", "reason")
+_MATCH_KEYS = ("topicality", "signal")
 
-    if api_response.get("error"):
-        err_data = api_response["error"]
-        err_msg = (
-            err_data.get("message", str(err_data))
-            if isinstance(err_data, dict)
-            else str(err_data)
-        )
-        _err(f"OpenAI response error: {err_msg}")
-        if http_client.DEBUG:
-            _err(f"Response snapshot: {json.dumps(api_response, indent=2)[:600]}")
-        return extracted
 
+def _output_text(api_response: Dict[str, Any]) -> str:
+    """The model's reply text from a Responses or Chat Completions payload."""
     output_text = ""
     output_data = api_response.get("output")
     if isinstance(output_data, str):
@@ -223,7 +247,35 @@ def parse_linkedin_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]
             if "message" in choice:
                 output_text = choice["message"].get("content", "")
                 break
+    return output_text
+
+
+def _worth_caching(api_response: Dict[str, Any]) -> bool:
+    """Cheap, silent stand-in for "parses to at least one post".
+
+    The caller parses the reply itself, so search() only checks that the
+    reply text mentions a LinkedIn URL instead of parsing it a second time
+    (and printing parse diagnostics twice).
+    """
+    return not api_response.get("error") and "linkedin.com" in _output_text(api_response)
+
+
+def parse_linkedin_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    extracted: List[Dict[str, Any]] = []
 
+    if api_response.get("error"):
+        err_data = api_response["error"]
+        err_msg = (
+            err_data.get("message", str(err_data))
+            if isinstance(err_data, dict)
+            else str(err_data)
+        )
+        _err(f"OpenAI response error: {err_msg}")
+        if http_client.debug_enabled():
+            _err(f"Response snapshot: {json.dumps(api_response, indent=2)[:600]}")
+        return extracted
+
+    output_text = _output_text(api_response)
     if not output_text:
         print(
             f"[LinkedIn] No output text found in response. Keys: {list(api_response.keys())}",
@@ -234,42 +286,42 @@ def parse_linkedin_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]
     raw_items = _extract_items(output_text)
 
     validated: List[Dict[str, Any]] = []
+    seen_urls: Set[str] = set()
     for idx, raw in enumerate(raw_items):
         if not isinstance(raw, dict):
             continue
 
-        link = raw.get("url", raw.get("link", ""))
-        if not link or "linkedin.com" not in link:
+        link = fields.text(fields.first(raw, _URL_KEYS))
+        if "linkedin.com" not in link:
+            continue
+        canon = link.split("?", 1)[0].rstrip("/").lower()
+        if canon in seen_urls:
             continue
+        seen_urls.add(canon)
+
+        signals_src = fields.first(raw, _SIGNAL_KEYS, {})
+        if not isinstance(signals_src, dict):
+            signals_src = {}
+        reactions = signals_src.get("reactions")
+        comments = signals_src.get("comments")
 
         item = {
             "key": f"LI-{idx + 1:02d}",
-            "snippet": str(raw.get("snippet", raw.get("excerpt", ""))).strip(),
+            "snippet": fields.text(fields.first(raw, _SNIPPET_KEYS)),
             "url": link,
-            "author": str(raw.get("author", "")).strip(),
-            "role": str(raw.get("role", "")).strip(),
-            "dated": raw.get("dated", raw.get("posted")),
+            "author": fields.text(raw.get("author")),
+            "role": fields.text(raw.get("role")),
+            "dated": fields.first(raw, _DATE_KEYS),
             "signals": {
-                "reactions": (
-                    int(raw.get("signals", raw.get("metrics", {})).get("reactions", 0))
-                    if raw.get("signals", raw.get("metrics", {})).get("reactions")
-                    else None
-                ),
-                "comments": (
-                    int(raw.get("signals", raw.get("metrics", {})).get("comments", 0))
-                    if raw.get("signals", raw.get("metrics", {})).get("comments")
-                    else None
-                ),
+                "reactions": int(reactions) if reactions else None,
+                "comments": int(comments) if comments else None,
             },
-            "rationale": str(raw.get("rationale", raw.get("reason", ""))).strip(),
-            "topicality": min(
-                1.0,
-                max(0.0, float(raw.get("topicality", raw.get("signal", 0.5)))),
-            ),
+            "rationale": fields.text(fields.first(raw, _RATIONALE_KEYS)),
+            "topicality": fields.unit_score(fields.first(raw, _MATCH_KEYS)),
         }
 
         if item["dated"]:
-            if not re.match(r"^\d{4}-\d{2}-\d{2}$", str(item["dated"])):
+            if not timeframe.is_iso_date(str(item["dated"])):
                 item["dated"] = None
 
         validated.append(item)
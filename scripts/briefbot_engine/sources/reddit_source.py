@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from .. import http_client
+from .. import http_client, timeframe
+from . import catalog, fields
 
 FALLBACK_MODELS = ["gpt-4.1-mini", "gpt-4.1"]
 
+# (api key, model) pairs that returned an access error during this process.
+_UNAVAILABLE_MODELS: Set[Tuple[str, str]] = set()
+
 
 def _err(msg: str) -> None:
     sys.stderr.write(f"[Reddit] {msg}\n")
@@ -22,21 +27,12 @@ def _info(msg: str) -> None:
     sys.stderr.flush()
 
 
-_ACCESS_PATTERNS = (
-    r"organization must be verified",
-    r"does not have access",
-    r"model .*not found",
-    r"not available for your account",
-    r"access denied",
-    r"unauthorized",
-)
+# Reddit also treats a bare "unauthorized" body as a refused model.
+_EXTRA_ACCESS_TOKENS = ("unauthorized",)
 
 
 def _is_access_err(err: http_client.HTTPError) -> bool:
-    if err.status_code not in (400, 401, 403, 404, 429) or not err.body:
-        return False
-    text = err.body.lower()
-    return any(re.search(pattern, text) for pattern in _ACCESS_PATTERNS)
+    return fields.is_access_error(err, _EXTRA_ACCESS_TOKENS)
 
 
 API_URL = "https://api.openai.com/v1/responses"
@@ -90,65 +86,57 @@ _FILLERS = (
     r"\btutorial(s)?\b",
     r"\bprompting\b",
 )
+_FILLERS_RE = re.compile("|".join(_FILLERS))
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9.+_-]*")
 _STOPWORDS = {"using", "for", "with", "the", "of", "in", "on", "a", "an", "latest", "new"}
-_ID_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_THREADS_ANCHOR = re.compile(r'\{\s*"threads"\s*:')
+_DECODER = json.JSONDecoder()
 
 
+@functools.lru_cache(maxsize=1024)
 def trim_query(verbose_query: str) -> str:
     """Reduce verbose queries to a compact search phrase."""
-    lowered = verbose_query.lower()
-    for pattern in _FILLERS:
-        lowered = re.sub(pattern, " ", lowered)
-    tokens = [
-        tok
-        for tok in re.findall(r"[a-z0-9][a-z0-9.+_-]*", lowered)
-        if tok not in _STOPWORDS
-    ]
+    lowered = _FILLERS_RE.sub(" ", verbose_query.lower())
+    tokens = [tok for tok in _TOKEN_RE.findall(lowered) if tok not in _STOPWORDS]
+    seen = set()
     compact = []
     for tok in tokens:
-        if tok in compact:
+        if tok in seen:
             continue
+        seen.add(tok)
         compact.append(tok)
         if len(compact) >= 5:
             break
     return " ".join(compact) or verbose_query
 
 
-def compress_topic(verbose_query: str) -> str:
-    """Compatibility alias for trim_query()."""
-    return trim_query(verbose_query)
-
-
-def _iter_text_chunks(output: Any) -> Iterable[str]:
+def _first_text(output: Any) -> str:
+    """Return the first non-empty text in a Responses ``output`` payload, depth first."""
     if isinstance(output, str):
-        yield output
-        return
+        return output.strip()
     if not isinstance(output, list):
-        return
-    for entry in output:
-        if isinstance(entry, str):
-            yield entry
-            continue
-        if not isinstance(entry, dict):
-            continue
-        text = entry.get("text")
+        return ""
+    pending = output[::-1]
+    while pending:
+        entry = pending.pop()
+        if isinstance(entry, dict):
+            text = entry.get("text")
+            content = entry.get("content")
+            if isinstance(content, list):
+                pending.extend(reversed(content))
+        else:
+            text = entry
         if isinstance(text, str):
-            yield text
-        content = entry.get("content", [])
-        if isinstance(content, list):
-            for block in content:
-                if not isinstance(block, dict):
-                    continue
-                block_text = block.get("text")
-                if isinstance(block_text, str):
-                    yield block_text
+            text = text.strip()
+            if text:
+                return text
+    return ""
 
 
 def _pick_output_text(api_response: Dict[str, Any]) -> str:
-    for chunk in _iter_text_chunks(api_response.get("output")):
-        text = chunk.strip()
-        if text:
-            return text
+    text = _first_text(api_response.get("output"))
+    if text:
+        return text
     for choice in api_response.get("choices", []):
         if not isinstance(choice, dict):
             continue
@@ -163,14 +151,21 @@ def _pick_output_text(api_response: Dict[str, Any]) -> str:
 def _extract_threads_blob(payload_text: str) -> List[Dict[str, Any]]:
     if not payload_text:
         return []
-    decoder = json.JSONDecoder()
+    anchor = _THREADS_ANCHOR.search(payload_text)
+    if anchor:
+        try:
+            obj, _ = _DECODER.raw_decode(payload_text, anchor.start())
+        except json.JSONDecodeError:
+            obj = None
+        if isinstance(obj, dict) and isinstance(obj.get("threads"), list):
+            return obj["threads"]
     cursor = 0
     while True:
         brace = payload_text.find("{", cursor)
         if brace < 0:
             return []
         try:
-            obj, end = decoder.raw_decode(payload_text[brace:])
+            obj, end = _DECODER.raw_decode(payload_text[brace:])
         except json.JSONDecodeError:
             cursor = brace + 1
             continue
@@ -179,25 +174,26 @@ def _extract_threads_blob(payload_text: str) -> List[Dict[str, Any]]:
         cursor = brace + max(end, 1)
 
 
-def _to_match(value: Any) -> float:
-    try:
-        return max(0.0, min(1.0, float(value)))
-    except (TypeError, ValueError):
-        return 0.5
+_URL_KEYS = ("url", "link")
+_DATE_KEYS = ("dated", "date", "posted")
+_FORUM_KEYS = ("forum", "subreddit", "community")
+_TITLE_KEYS = ("headline", "title")
+_RATIONALE_KEYS = ("rationale", "why", "reason")
+_MATCH_KEYS = ("topicality", "signal")
 
 
 def _normalize_item(raw: Dict[str, Any], ordinal: int) -> Optional[Dict[str, Any]]:
-    link = str(raw.get("url", raw.get("link", ""))).strip()
+    link = fields.text(fields.first(raw, _URL_KEYS))
     if "reddit.com" not in link:
         return None
-    date_value = raw.get("dated", raw.get("date", raw.get("posted")))
-    if date_value is not None and not _ID_DATE.match(str(date_value)):
+    date_value = fields.first(raw, _DATE_KEYS)
+    if date_value is not None and not timeframe.is_iso_date(str(date_value)):
         date_value = None
-    community = str(raw.get("forum", raw.get("subreddit", raw.get("community", "")))).strip()
+    community = fields.text(fields.first(raw, _FORUM_KEYS))
     if community.lower().startswith("r/"):
         community = community[2:]
-    title = str(raw.get("headline", raw.get("title", ""))).strip()
-    why = str(raw.get("rationale", raw.get("why", raw.get("reason", "")))).strip()
+    title = fields.text(fields.first(raw, _TITLE_KEYS))
+    why = fields.text(fields.first(raw, _RATIONALE_KEYS))
     return {
         "key": f"RDT-{ordinal:02d}",
         "headline": title,
@@ -205,41 +201,32 @@ def _normalize_item(raw: Dict[str, Any], ordinal: int) -> Optional[Dict[str, Any
         "forum": community,
         "dated": date_value,
         "rationale": why,
-        "topicality": _to_match(raw.get("topicality", raw.get("signal"))),
+        "topicality": fields.unit_score(fields.first(raw, _MATCH_KEYS)),
     }
 
 
-def search(
+def _usable_models(key: str, candidates: List[str]) -> List[str]:
+    """Drop models this key was already refused, keeping the chain non-empty."""
+    usable = [candidate for candidate in candidates if (key, candidate) not in _UNAVAILABLE_MODELS]
+    return usable or candidates
+
+
+def _post_with_fallback(
     key: str,
     model: str,
-    topic: str,
-    start: str,
-    end: str,
-    sampling: str = "standard",
-    mock_response: Optional[Dict] = None,
-    _is_retry: bool = False,
+    prompt: str,
+    sampling: str,
+    query_hint: str,
+    max_output_tokens: int,
 ) -> Dict[str, Any]:
-    if mock_response is not None:
-        return mock_response
-
-    sampling_spec = SAMPLING_SPECS.get(sampling, SAMPLING_SPECS["standard"])
-    min_items = sampling_spec["min"]
-    max_items = sampling_spec["max"]
-    query_hint = trim_query(topic)
+    """POST the prompt, walking the model fallback chain on access errors."""
     headers = {"Authorization": f"Bearer {key}"}
     timeout = {"lite": 60, "standard": 90, "dense": 150}.get(sampling, 90)
     model_candidates = [model]
     for candidate in FALLBACK_MODELS:
         if candidate not in model_candidates:
             model_candidates.append(candidate)
-    prompt = REDDIT_DISCOVERY_PROMPT.format(
-        topic=topic,
-        from_date=start,
-        to_date=end,
-        min_items=min_items,
-        max_items=max_items,
-        query_hint=query_hint,
-    )
+    model_candidates = _usable_models(key, model_candidates)
 
     final_error = None
     for candidate in model_candidates:
@@ -253,7 +240,7 @@ def search(
                 {"type": "web_search", "filters": {"allowed_domains": ["reddit.com", "old.reddit.com"]}}
             ],
             "temperature": 0.2,
-            "max_output_tokens": 1200,
+            "max_output_tokens": max_output_tokens,
             "metadata": {"query_hint": query_hint, "sampling": sampling},
         }
         try:
@@ -267,6 +254,7 @@ def search(
         except http_client.HTTPError as exc:
             final_error = exc
             if _is_access_err(exc):
+                _UNAVAILABLE_MODELS.add((key, candidate))
                 _info(f"Model {candidate} unavailable for this key, trying fallback...")
                 continue
             raise
@@ -277,38 +265,104 @@ def search(
     raise http_client.HTTPError("No compatible model could be selected")
 
 
-def parse_reddit_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]:
+@functools.lru_cache(maxsize=64)
+def _discovery_prompt(topic: str, start: str, end: str, sampling: str) -> Tuple[str, str]:
+    """Render the discovery prompt and query hint; repeat inputs reuse the rendered text."""
+    sampling_spec = SAMPLING_SPECS.get(sampling, SAMPLING_SPECS["standard"])
+    query_hint = trim_query(topic)
+    prompt = REDDIT_DISCOVERY_PROMPT.format(
+        topic=topic,
+        from_date=start,
+        to_date=end,
+        min_items=sampling_spec["min"],
+        max_items=sampling_spec["max"],
+        query_hint=query_hint,
+    )
+    return prompt, query_hint
+
+
+def search(
+    key: str,
+    model: str,
+    topic: str,
+    start: str,
+    end: str,
+    sampling: str = "standard",
+    mock_response: Optional[Dict] = None,
+    _is_retry: bool = False,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    if mock_response is not None:
+        return mock_response
+
+    cache_id = catalog.cache_key(topic, start, end, f"reddit:{sampling}:{model}")
+    if use_cache:
+        cached = catalog.load(cache_id)
+        if cached is not None:
+            _info("Using cached response")
+            return cached
+
+    prompt, query_hint = _discovery_prompt(topic, start, end, sampling)
+    response = _post_with_fallback(key, model, prompt, sampling, query_hint, 1200)
+    # Only cache replies that look like they hold threads, so an empty or
+    # failed answer is retried on the next run instead of sticking for the
+    # cache lifetime.  The caller parses the reply; a substring check keeps
+    # search() from parsing it twice and repeating parse diagnostics.
+    if not response.get("error") and "reddit.com" in _pick_output_text(response):
+        catalog.save(cache_id, response)
+    return response
+
+
+def _response_text(api_response: Dict[str, Any]) -> str:
     api_error = api_response.get("error")
     if api_error:
         message = (
             api_error.get("message") if isinstance(api_error, dict) else str(api_error)
         )
         _err(f"OpenAI API reported an error: {message}")
-        if http_client.DEBUG:
+        if http_client.debug_enabled():
             _err(f"Error payload snapshot: {json.dumps(api_response, indent=2)[:650]}")
-        return []
+        return ""
 
     raw_text = _pick_output_text(api_response)
     if not raw_text:
         _err(
             f"No text output returned by model. Response keys: {sorted(api_response.keys())}"
         )
-        return []
+    return raw_text
 
-    raw_items = _extract_threads_blob(raw_text)
+
+def _canonical_url(link: str) -> str:
+    return link.split("?", 1)[0].rstrip("/").lower()
+
+
+def _normalize_rows(raw_items: List[Any]) -> List[Dict[str, Any]]:
     parsed: List[Dict[str, Any]] = []
+    seen_urls: Set[str] = set()
     for index, row in enumerate(raw_items, start=1):
         if not isinstance(row, dict):
             continue
+        link = fields.text(fields.first(row, _URL_KEYS))
+        if "reddit.com" not in link:
+            continue
+        canon = _canonical_url(link)
+        if canon in seen_urls:
+            continue
+        seen_urls.add(canon)
         normalized = _normalize_item(row, index)
         if normalized is not None:
             parsed.append(normalized)
     return parsed
 
 
-# Compatibility aliases for alternate naming conventions
-search_reddit = search
+def parse_reddit_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    raw_text = _response_text(api_response)
+    if not raw_text:
+        return []
+    return _normalize_rows(_extract_threads_blob(raw_text))
 
 
-def _extract_core_subject(topic: str) -> str:
-    return trim_query(topic)
+# Compatibility aliases for alternate naming conventions
+search_reddit = search
+compress_topic = trim_query
+_extract_core_subject = trim_query
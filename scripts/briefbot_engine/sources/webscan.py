@@ -1,8 +1,8 @@
 """Process and normalize web search results with date extraction."""
 
 import re
+from datetime import datetime
 from typing import Any, Dict, List
-from urllib.parse import urlparse
 
 from .. import timeframe
 from ..records import Signal, from_web_raw
@@ -17,28 +17,39 @@ EXCLUDED_DOMAINS = {
     "x.com",
     "t.co",
 }
+# str.endswith() takes a tuple, so every subdomain check is one C call.
+_EXCLUDED_SUFFIXES = tuple("." + domain for domain in EXCLUDED_DOMAINS)
+
+_WWW_RE = re.compile(r"^(https?://)www\.", re.IGNORECASE)
 
 
 def _domain(url: str) -> str:
-    """Extract the bare domain from a URL, stripping www prefix."""
-    try:
-        host = urlparse(url).netloc.lower()
-        if host.startswith("www."):
-            host = host[4:]
-        return host
-    except Exception:
-        return ""
+    """Extract the bare host from a URL, stripping any www prefix.
+
+    Slices the authority directly instead of running urlparse(), since only
+    the host is needed and this runs for every web result.
+    """
+    start = url.find("://")
+    start = start + 3 if start >= 0 else 0
+    end = len(url)
+    for sep in "/?#":
+        idx = url.find(sep, start, end)
+        if idx >= 0:
+            end = idx
+    host = url[start:end].lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def _is_excluded_host(host: str) -> bool:
+    """Return True for an excluded domain or any of its subdomains."""
+    return host in EXCLUDED_DOMAINS or host.endswith(_EXCLUDED_SUFFIXES)
 
 
 def _is_excluded(url: str) -> bool:
     """Return True if the URL belongs to an excluded domain."""
-    try:
-        host = urlparse(url).netloc.lower()
-        if host.startswith("www."):
-            host = host[4:]
-        return host in EXCLUDED_DOMAINS
-    except Exception:
-        return False
+    return _is_excluded_host(_domain(url))
 
 
 def process_results(
@@ -49,6 +60,7 @@ def process_results(
 ) -> List[Dict[str, Any]]:
     """Transform raw WebSearch results into normalised, date-filtered items."""
     processed = []
+    now = datetime.now()
 
     for raw in raw_results:
         if not isinstance(raw, dict):
@@ -58,7 +70,8 @@ def process_results(
         if not link:
             continue
 
-        if _is_excluded(link):
+        host = _domain(link)
+        if _is_excluded_host(host):
             continue
 
         title = str(raw.get("title", "")).strip()
@@ -68,15 +81,16 @@ def process_results(
             continue
 
         result_date = raw.get("date")
-        confidence = timeframe.CONFIDENCE_UNKNOWN
+        if result_date and not isinstance(result_date, str):
+            result_date = str(result_date)
 
-        if result_date and re.match(r"^\d{4}-\d{2}-\d{2}$", str(result_date)):
+        if result_date and timeframe.is_iso_date(result_date):
             confidence = timeframe.CONFIDENCE_SOFT
         else:
-            detected, det_conf = timeframe.detect_date(link, snippet, title)
+            # detect_date() already reports CONFIDENCE_UNKNOWN when it finds nothing.
+            detected, confidence = timeframe.detect_date(link, snippet, title, now)
             if detected:
                 result_date = detected
-                confidence = det_conf
 
         if result_date and start and result_date < start:
             continue
@@ -95,7 +109,7 @@ def process_results(
                 "key": f"W-{len(processed) + 1:02d}",
                 "headline": title[:250],
                 "url": link,
-                "domain": _domain(link),
+                "domain": host,
                 "snippet": snippet[:400],
                 "dated": result_date,
                 "time_confidence": confidence,
@@ -117,16 +131,9 @@ def to_items(
 
 
 def dedup_urls(items: List[Signal]) -> List[Signal]:
-    """Remove duplicate Signals by normalised URL."""
-    seen = set()
-    unique = []
-
+    """Remove duplicate Signals by normalised URL, keeping the first seen."""
+    unique: Dict[str, Signal] = {}
     for item in items:
-        normalised = item.url.lower().rstrip("/")
-        normalised = re.sub(r"^(https?://)www\.", r"\1", normalised)
-        normalised = normalised.split("?")[0]
-        if normalised not in seen:
-            seen.add(normalised)
-            unique.append(item)
-
-    return unique
+        normalised = _WWW_RE.sub(r"\1", item.url).partition("?")[0].rstrip("/").lower()
+        unique.setdefault(normalised, item)
+    return list(unique.values())
@@ -307,7 +307,7 @@ def parse_x_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]:
             api_error.get("message") if isinstance(api_error, dict) else str(api_error)
         )
         _err(f"xAI response error: {message}")
-        if http_client.DEBUG:
+        if http_client.debug_enabled():
             _err(f"Response snapshot: {json.dumps(api_response, indent=2)[:600]}")
         _log("=== parse_x_response END (api error) ===")
         return items
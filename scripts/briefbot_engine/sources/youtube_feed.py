@@ -8,6 +8,7 @@ import sys
 from typing import Any, Dict, List, Optional
 
 from .. import http_client
+from . import fields
 
 FALLBACK_MODELS = ["gpt-4o", "gpt-4o-mini"]
 
@@ -22,20 +23,7 @@ def _info(msg: str) -> None:
     sys.stderr.flush()
 
 
-_ACCESS_PATTERNS = (
-    r"organization must be verified",
-    r"does not have access",
-    r"access denied",
-    r"model .*not found",
-    r"not available for your account",
-)
-
-
-def _is_access_err(err: http_client.HTTPError) -> bool:
-    if err.status_code not in (400, 401, 403, 404, 429) or not err.body:
-        return False
-    lowered = err.body.lower()
-    return any(re.search(pattern, lowered) for pattern in _ACCESS_PATTERNS)
+_is_access_err = fields.is_access_error
 
 
 API_URL = "https://api.openai.com/v1/responses"
@@ -195,7 +183,7 @@ def parse_youtube_response(api_response: Dict[str, Any]) -> List[Dict[str, Any]]
             else str(err_data)
         )
         _err(f"OpenAI response error: {err_msg}")
-        if http_client.DEBUG:
+        if http_client.debug_enabled():
             _err(f"Response snapshot: {json.dumps(api_response, indent=2)[:600]}")
         return extracted
 
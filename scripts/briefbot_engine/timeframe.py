@@ -1,18 +1,21 @@
 """Time-window and publication-date utilities."""
 
+import functools
 import re
+import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
-_STRPTIME_PATTERNS = (
+_ISO_PATTERNS = (
     "%Y-%m-%dT%H:%M:%S.%f%z",
     "%Y-%m-%dT%H:%M:%SZ",
     "%Y-%m-%dT%H:%M:%S",
     "%Y-%m-%d",
-    "%B %d, %Y",
-    "%d/%m/%Y",
 )
+_SLASH_PATTERNS = ("%d/%m/%Y",)
+_MONTH_NAME_PATTERNS = ("%B %d, %Y",)
 
+# Keyed by every spelling _MONTH_NAMES can capture, so lookups need no slicing.
 _MONTH_TO_INT = {
     "jan": 1,
     "january": 1,
@@ -30,6 +33,7 @@ _MONTH_TO_INT = {
     "aug": 8,
     "august": 8,
     "sep": 9,
+    "sept": 9,
     "september": 9,
     "oct": 10,
     "october": 10,
@@ -39,28 +43,121 @@ _MONTH_TO_INT = {
     "december": 12,
 }
 
+_MONTH_NAMES = (
+    r"(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|"
+    r"jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+# /YYYY/MM/DD/ and /YYYY-MM-DD[-/] in one pass over the URL (compact
+# /YYYYMMDD/ is sliced without regex).  Trailing separators are lookaheads
+# so an implausible match never swallows the slash that opens the next one.
+_URL_DATE_RE = re.compile(
+    r"/(\d{4})(?:/(\d{2})/(\d{2})(?=/)|-(\d{2})-(\d{2})(?=[-/]))"
+)
+_MONTH_FIRST_RE = re.compile(r"\b" + _MONTH_NAMES + r"\s+(\d{1,2})(?:st|nd|rd|th)?,?\s*(\d{4})\b")
+_DAY_FIRST_RE = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+" + _MONTH_NAMES + r"\s+(\d{4})\b")
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_MAX_DAYS_AGO = 90
+_RELATIVE_PHRASES = (
+    ("last week", 7),
+    ("this week", 4),
+    ("last month", 30),
+)
+# Plausible publish-date bounds, compared as fixed-width digit strings
+# (lexicographic order equals numeric order at equal width).
+_MIN_YEAR = "2019"
+_MAX_YEAR = "2033"
+_VALID_MONTHS = frozenset(f"{month:02d}" for month in range(1, 13))
+_VALID_DAYS = frozenset(f"{day:02d}" for day in range(1, 32))
+# Shortest text any branch can match: "today".
+_MIN_DATE_TEXT = 5
+_DIGIT_RE = re.compile(r"\d")
+_MONTH_HINT_RE = re.compile(r"jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec")
+_DAYS_AGO_RE = re.compile(r"\b(\d+)\s*days?\s*ago\b")
+_HOURS_AGO_RE = re.compile(r"\b(\d+)\s*hours?\s*ago\b")
+
 CONFIDENCE_SOLID = "high"
 CONFIDENCE_SOFT = "medium"
 CONFIDENCE_WEAK = "low"
 CONFIDENCE_UNKNOWN = "unknown"
 
 
-def _today_utc() -> date:
-    return datetime.now(timezone.utc).date()
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def today_utc() -> date:
+    """Current UTC calendar date; read once per batch and pass as *today*.
+
+    Unix time counts whole 86400-second UTC days, so the date follows from
+    one float clock read; the date object itself is built once per day.
+    """
+    return _utc_day(int(time.time() // 86400))
+
+
+@functools.lru_cache(maxsize=2)
+def _utc_day(epoch_day: int) -> date:
+    return date.fromordinal(_EPOCH_ORDINAL + epoch_day)
 
 
 def _as_iso_date(value: date) -> str:
     return value.isoformat()
 
 
+def is_iso_date(value: str) -> bool:
+    """Return True when value has the exact `YYYY-MM-DD` shape."""
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:].isdecimal()
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_day(value: Union[str, date]) -> date:
+    """Parse a `YYYY-MM-DD` string with the C fast path; dates pass through.
+
+    Other shapes go through strptime("%Y-%m-%d"), which also accepts
+    unpadded months and days ("2026-1-5") and rejects the compact and week
+    forms fromisoformat() would take.
+
+    Memoized: a batch repeats the same range bounds for every item and
+    the same handful of item dates many times over.
+    """
+    if isinstance(value, date):
+        return value
+    if is_iso_date(value):
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _plausible_ymd(year: str, month: str, day: str) -> bool:
+    return _MIN_YEAR <= year <= _MAX_YEAR and month in _VALID_MONTHS and day in _VALID_DAYS
+
+
 def span(days: int = 30) -> Tuple[str, str]:
     """Return start/end bounds for a rolling UTC calendar window."""
-    end_day = _today_utc()
+    end_day = today_utc()
     back_days = max(0, int(days or 0))
     start_day = end_day - timedelta(days=back_days)
     return _as_iso_date(start_day), _as_iso_date(end_day)
 
 
+def _candidate_patterns(text: str) -> Tuple[str, ...]:
+    """Pick the only strptime formats that can match this string's shape."""
+    # Any YYYY- prefix, whatever its length: strptime also takes unpadded
+    # months and days ("2026-1-5").
+    if len(text) > 4 and text[4] == "-" and text[:4].isdecimal():
+        return _ISO_PATTERNS
+    if "/" in text:
+        return _SLASH_PATTERNS
+    if text[0].isalpha():
+        return _MONTH_NAME_PATTERNS
+    return ()
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_moment(date_input: Optional[str]) -> Optional[datetime]:
     """Parse known date shapes into a UTC datetime."""
     if not date_input:
@@ -70,16 +167,19 @@ def parse_moment(date_input: Optional[str]) -> Optional[datetime]:
     if not text:
         return None
 
-    iso_candidate = text.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(iso_candidate)
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
-        return parsed.astimezone(timezone.utc)
-    except ValueError:
-        pass
-
-    for fmt in _STRPTIME_PATTERNS:
+    # ISO 8601 always starts with a digit and never contains "/", so the
+    # month-name and slash shapes skip the C fast path they would only fail.
+    if text[0].isdigit() and "/" not in text:
+        iso_candidate = text[:-1] + "+00:00" if text[-1] == "Z" else text
+        try:
+            parsed = datetime.fromisoformat(iso_candidate)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone(timezone.utc)
+        except ValueError:
+            pass
+
+    for fmt in _candidate_patterns(text):
         try:
             parsed = datetime.strptime(text, fmt)
             return parsed.replace(tzinfo=timezone.utc)
@@ -104,17 +204,20 @@ def to_iso_date(unix_timestamp: Optional[float]) -> Optional[str]:
 
 def date_confidence(
     date_input: Optional[str],
-    range_start: str,
-    range_end: str,
+    range_start: Union[str, date],
+    range_end: Union[str, date],
 ) -> str:
-    """Return confidence of date against the target range."""
+    """Return confidence of date against the target range.
+
+    Batch callers may pass the range bounds as pre-parsed dates.
+    """
     if not date_input:
         return CONFIDENCE_UNKNOWN
     try:
-        parsed = datetime.strptime(date_input, "%Y-%m-%d").date()
-        start_day = datetime.strptime(range_start, "%Y-%m-%d").date()
-        end_day = datetime.strptime(range_end, "%Y-%m-%d").date()
-    except ValueError:
+        parsed = _to_day(date_input)
+        start_day = _to_day(range_start)
+        end_day = _to_day(range_end)
+    except (TypeError, ValueError):
         return CONFIDENCE_UNKNOWN
 
     if start_day <= parsed <= end_day:
@@ -132,20 +235,30 @@ def date_confidence(
     return CONFIDENCE_UNKNOWN
 
 
-def days_since(date_input: Optional[str]) -> Optional[int]:
-    """Return full days elapsed since date_input."""
+def days_since(date_input: Optional[str], today: Optional[date] = None) -> Optional[int]:
+    """Return full days elapsed since date_input (relative to *today*, default UTC now)."""
     if not date_input:
         return None
+    return _elapsed_days(date_input, today or today_utc())
+
+
+@functools.lru_cache(maxsize=4096)
+def _elapsed_days(date_input: str, today: date) -> Optional[int]:
+    # Keyed on today as well, so a long-running process never serves
+    # yesterday's answer.
     try:
-        parsed = datetime.strptime(date_input, "%Y-%m-%d").date()
-        return (_today_utc() - parsed).days
-    except ValueError:
+        return (today - _to_day(date_input)).days
+    except (TypeError, ValueError):
         return None
 
 
-def recency_score(date_input: Optional[str], max_days: int = 30) -> int:
+def recency_score(
+    date_input: Optional[str],
+    max_days: int = 30,
+    today: Optional[date] = None,
+) -> int:
     """Return curved recency score in [0,100]."""
-    age = days_since(date_input)
+    age = days_since(date_input, today)
     if age is None:
         return 0
     if age < 0:
@@ -157,134 +270,138 @@ def recency_score(date_input: Optional[str], max_days: int = 30) -> int:
     return int(100 * (remaining ** 1.12))
 
 
+@functools.lru_cache(maxsize=4096)
 def scan_url_date(url: str) -> Optional[str]:
     """Extract a plausible publish date from URL patterns."""
-    patterns = (
-        r"/(\d{4})(\d{2})(\d{2})/",
-        r"/(\d{4})/(\d{2})/(\d{2})/",
-        r"/(\d{4})-(\d{2})-(\d{2})[-/]",
-    )
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if not match:
-            continue
-        year, month, day = match.groups()
-        if 2019 <= int(year) <= 2033 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-            return f"{year}-{month}-{day}"
-    return None
-
-
-def scan_text_date(text: str) -> Optional[str]:
-    """Extract a date-like value from natural language."""
-    if not text:
+    # Every plausible year starts with "20", so URLs without "/20" cannot
+    # match; the common compact /YYYYMMDD/ form is sliced without regex.
+    pos = url.find("/20")
+    if pos < 0:
+        return None
+    while pos >= 0:
+        digits = url[pos + 1 : pos + 9]
+        if url[pos + 9 : pos + 10] == "/" and len(digits) == 8 and digits.isdecimal():
+            year, month, day = digits[:4], digits[4:6], digits[6:]
+            if _plausible_ymd(year, month, day):
+                return f"{year}-{month}-{day}"
+        pos = url.find("/20", pos + 1)
+
+    # Shape priority is compact, then slashes, then dashes; within a shape
+    # the leftmost plausible date wins.
+    dashed = None
+    for match in _URL_DATE_RE.finditer(url):
+        year, slash_month, slash_day, dash_month, dash_day = match.groups()
+        if slash_month is not None:
+            if _plausible_ymd(year, slash_month, slash_day):
+                return f"{year}-{slash_month}-{slash_day}"
+        elif dashed is None and _plausible_ymd(year, dash_month, dash_day):
+            dashed = f"{year}-{dash_month}-{dash_day}"
+    return dashed
+
+
+def scan_text_date(text: str, now: Optional[datetime] = None) -> Optional[str]:
+    """Extract a date-like value from natural language.
+
+    Relative phrases ("yesterday", "3 days ago") resolve against *now*,
+    which batch callers pass once instead of reading the clock per text.
+    """
+    if not text or len(text) < _MIN_DATE_TEXT:
         return None
 
     lowered = text.lower()
+    # Every absolute or "N ago" form needs a digit; month forms also need a
+    # month token. These scans are far cheaper than the full patterns.
+    has_digit = _DIGIT_RE.search(lowered) is not None
+
+    if has_digit and _MONTH_HINT_RE.search(lowered):
+        month_first = _MONTH_FIRST_RE.search(lowered)
+        if month_first:
+            month_str, day_str, year_str = month_first.groups()
+            month_num = _MONTH_TO_INT[month_str]
+            day_str = day_str.zfill(2)
+            if _MIN_YEAR <= year_str <= _MAX_YEAR and day_str in _VALID_DAYS:
+                return f"{year_str}-{month_num:02d}-{day_str}"
+
+        day_first = _DAY_FIRST_RE.search(lowered)
+        if day_first:
+            day_str, month_str, year_str = day_first.groups()
+            month_num = _MONTH_TO_INT[month_str]
+            day_str = day_str.zfill(2)
+            if _MIN_YEAR <= year_str <= _MAX_YEAR and day_str in _VALID_DAYS:
+                return f"{year_str}-{month_num:02d}-{day_str}"
+
+    if has_digit and "-" in text:
+        iso = _ISO_DATE_RE.search(text)
+        if iso:
+            year, month, day = iso.groups()
+            if _plausible_ymd(year, month, day):
+                return f"{year}-{month}-{day}"
+
+    days_back = _relative_days_back(lowered, has_digit)
+    if days_back is None:
+        return None
+    return _recent_iso_days((now or datetime.now()).date())[days_back]
 
-    month_first = re.search(
-        r"\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|"
-        r"jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
-        r"\s+(\d{1,2})(?:st|nd|rd|th)?,?\s*(\d{4})\b",
-        lowered,
-    )
-    if month_first:
-        month_str, day_str, year_str = month_first.groups()
-        month_num = _MONTH_TO_INT.get(month_str[:3])
-        if month_num and 2019 <= int(year_str) <= 2033 and 1 <= int(day_str) <= 31:
-            return f"{year_str}-{month_num:02d}-{int(day_str):02d}"
-
-    day_first = re.search(
-        r"\b(\d{1,2})(?:st|nd|rd|th)?\s+"
-        r"(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|"
-        r"jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
-        r"\s+(\d{4})\b",
-        lowered,
-    )
-    if day_first:
-        day_str, month_str, year_str = day_first.groups()
-        month_num = _MONTH_TO_INT.get(month_str[:3])
-        if month_num and 2019 <= int(year_str) <= 2033 and 1 <= int(day_str) <= 31:
-            return f"{year_str}-{month_num:02d}-{int(day_str):02d}"
-
-    iso = re.search(r"\b(\d{4})-(\d{2})-(\d{2})\b", text)
-    if iso:
-        year, month, day = iso.groups()
-        if 2019 <= int(year) <= 2033 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-            return f"{year}-{month}-{day}"
-
-    now = datetime.now()
+
+def _relative_days_back(lowered: str, has_digit: bool) -> Optional[int]:
+    """Days before today named by a relative phrase, or None."""
     if "yesterday" in lowered:
-        return (now - timedelta(days=1)).strftime("%Y-%m-%d")
+        return 1
     if "today" in lowered:
-        return now.strftime("%Y-%m-%d")
-
-    ago_days = re.search(r"\b(\d+)\s*days?\s*ago\b", lowered)
-    if ago_days:
-        span = int(ago_days.group(1))
-        if span <= 90:
-            return (now - timedelta(days=span)).strftime("%Y-%m-%d")
-
-    ago_hours = re.search(r"\b(\d+)\s*hours?\s*ago\b", lowered)
-    if ago_hours:
-        return now.strftime("%Y-%m-%d")
-
-    relative_map = {
-        "last week": 7,
-        "this week": 4,
-        "last month": 30,
-    }
-    for label, days_back in relative_map.items():
-        if label in lowered:
-            return (now - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        return 0
+
+    if has_digit and "ago" in lowered:
+        ago_days = _DAYS_AGO_RE.search(lowered)
+        if ago_days:
+            days_back = int(ago_days.group(1))
+            if days_back <= _MAX_DAYS_AGO:
+                return days_back
 
+        if _HOURS_AGO_RE.search(lowered):
+            return 0
+
+    for label, days_back in _RELATIVE_PHRASES:
+        if label in lowered:
+            return days_back
     return None
 
 
+@functools.lru_cache(maxsize=2)
+def _recent_iso_days(today: date) -> Tuple[str, ...]:
+    """ISO strings for today and each of the previous _MAX_DAYS_AGO days."""
+    return tuple((today - timedelta(days=offset)).isoformat() for offset in range(_MAX_DAYS_AGO + 1))
+
+
 def detect_date(
     url: str,
     snippet: str,
     title: str,
+    now: Optional[datetime] = None,
 ) -> Tuple[Optional[str], str]:
     """Choose best available date signal from URL/title/snippet."""
     url_date = scan_url_date(url)
     if url_date:
         return url_date, CONFIDENCE_SOLID
 
-    title_date = scan_text_date(title)
+    if not title and not snippet:
+        return None, CONFIDENCE_UNKNOWN
+
+    title_date = scan_text_date(title, now)
     if title_date:
         return title_date, CONFIDENCE_SOFT
 
-    snippet_date = scan_text_date(snippet)
+    snippet_date = scan_text_date(snippet, now)
     if snippet_date:
         return snippet_date, CONFIDENCE_WEAK
 
     return None, CONFIDENCE_UNKNOWN
 
 
-def parse_date(date_str: Optional[str]) -> Optional[datetime]:
-    """Compatibility alias for parse_moment()."""
-    return parse_moment(date_str)
-
-
-def days_ago(date_str: Optional[str]) -> Optional[int]:
-    """Compatibility alias for days_since()."""
-    return days_since(date_str)
-
-
-def get_date_range(days: int = 30) -> Tuple[str, str]:
-    """Compatibility alias for span()."""
-    return span(days)
-
-
-def timestamp_to_date(unix_timestamp: Optional[float]) -> Optional[str]:
-    """Compatibility alias for to_iso_date()."""
-    return to_iso_date(unix_timestamp)
-
-
-def get_date_confidence(
-    date_value: Optional[str],
-    range_start: str,
-    range_end: str,
-) -> str:
-    """Compatibility alias for date_confidence()."""
-    return date_confidence(date_value, range_start, range_end)
+# Compatibility aliases, bound directly to the canonical functions so the
+# older names cost no extra call frame (records.py calls
+# get_date_confidence once per item).
+parse_date = parse_moment
+days_ago = days_since
+get_date_range = span
+timestamp_to_date = to_iso_date
+get_date_confidence = date_confidence
@@ -8,7 +8,9 @@
 #
 
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Fix Windows console encoding
@@ -20,8 +22,62 @@ if sys.platform == "win32":
 MODULE_ROOT = Path(__file__).parent.resolve()
 sys.path.insert(0, str(MODULE_ROOT))
 
+# Delivery artefacts land here; pure paths, so they are built once.
+OUTPUT_DIR = MODULE_ROOT.parent / "output"
+AUDIO_TARGET = OUTPUT_DIR / "briefbot.mp3"
+PDF_TARGET = OUTPUT_DIR / "briefing.pdf"
+
 from briefbot_engine import settings as bb_config
-from briefbot_engine.delivery import email as email_delivery, telegram, audio, document
+
+# Delivery backends are imported inside the branch that uses them, so an
+# --audio-only run never loads smtplib/MIME and an email run never loads
+# the Telegram client.
+
+
+def _read_briefing(content_path, content_size):
+    """Read the briefing as text, translating newlines as read_text() would."""
+    if not content_size:
+        return ""
+    with open(content_path, "rb") as fh:
+        text = fh.read().decode("utf-8")
+    # A binary read skips universal-newline translation; Windows-written
+    # (CRLF) briefings would otherwise carry "\r" into HTML, Telegram and TTS.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _render_audio(briefing_text, config):
+    """Synthesize the MP3; returns its path, or None if synthesis failed."""
+    from briefbot_engine.delivery import audio
+
+    try:
+        audio.generate_audio(
+            briefing_text,
+            AUDIO_TARGET,
+            elevenlabs_api_key=config.get("ELEVENLABS_API_KEY"),
+            elevenlabs_voice_id=config.get("ELEVENLABS_VOICE_ID"),
+        )
+        print(f"Audio saved to {AUDIO_TARGET}")
+        return AUDIO_TARGET
+    except Exception as err:
+        print(f"Audio generation failed: {err}", file=sys.stderr)
+        return None
+
+
+def _render_pdf(subject, briefing_text):
+    """Render the newsletter PDF; returns its path, or None if unavailable."""
+    from briefbot_engine.delivery import document, email as email_delivery
+
+    try:
+        newsletter_html = email_delivery.build_newsletter_html(subject, briefing_text)
+        pdf_path = document.generate_pdf(newsletter_html, PDF_TARGET)
+        if pdf_path:
+            print(f"PDF saved to {pdf_path}")
+        return pdf_path
+    except Exception as err:
+        print(f"PDF generation failed: {err}", file=sys.stderr)
+        return None
 
 
 def main():
@@ -61,78 +117,38 @@ def main():
     )
     args = parser.parse_args()
 
-    # Read the synthesized content
+    # Read the synthesized content. One stat answers both "does it exist" and "is it empty"; a non-empty
+    # file is then read as bytes and decoded once.
     content_path = Path(args.content)
-    if not content_path.exists():
-        print("Error: Content file not found: {}".format(content_path), file=sys.stderr)
+    try:
+        content_size = os.stat(content_path).st_size
+    except FileNotFoundError:
+        print(f"Error: Content file not found: {content_path}", file=sys.stderr)
         sys.exit(1)
 
-    briefing_text = content_path.read_text(encoding="utf-8")
+    briefing_text = _read_briefing(content_path, content_size)
     if not briefing_text.strip():
-        print("Error: Content file is empty: {}".format(content_path), file=sys.stderr)
+        print(f"Error: Content file is empty: {content_path}", file=sys.stderr)
         sys.exit(1)
 
     config = bb_config.load_config()
-    audio_path = None
-
-    # Generate audio first so it can be attached to the email
-    if args.audio:
-        try:
-            output_dir = MODULE_ROOT.parent / "output"
-            audio_path = output_dir / "briefbot.mp3"
-            audio.generate_audio(
-                briefing_text,
-                audio_path,
-                elevenlabs_api_key=config.get("ELEVENLABS_API_KEY"),
-                elevenlabs_voice_id=config.get("ELEVENLABS_VOICE_ID"),
-            )
-            print("Audio saved to {}".format(audio_path))
-        except Exception as err:
-            print("Audio generation failed: {}".format(err), file=sys.stderr)
-            audio_path = None
-
-    # Send email (with auto-generated PDF attachment)
+
+    # Check every requested channel before rendering anything, so a
+    # misconfigured channel fails fast instead of after TTS and the PDF.
     if args.email:
+        from briefbot_engine.delivery import email as email_delivery
+
         smtp_error = email_delivery.validate_smtp_config(config)
         if smtp_error:
-            print("Error: {}".format(smtp_error), file=sys.stderr)
-            sys.exit(1)
-
-        # Build the newsletter HTML and render a PDF from it
-        output_dir = MODULE_ROOT.parent / "output"
-        pdf_path = None
-        try:
-            newsletter_html = email_delivery.build_newsletter_html(
-                args.subject, briefing_text
-            )
-            pdf_path = document.generate_pdf(
-                newsletter_html, output_dir / "briefing.pdf"
-            )
-            if pdf_path:
-                print("PDF saved to {}".format(pdf_path))
-        except Exception as err:
-            print("PDF generation failed: {}".format(err), file=sys.stderr)
-
-        try:
-            email_delivery.send_report_email(
-                recipient=args.email,
-                subject=args.subject,
-                markdown_body=briefing_text,
-                config=config,
-                audio_path=audio_path,
-                pdf_path=pdf_path,
-            )
-            recipients = email_delivery.parse_recipients(args.email)
-            print("Email sent to {}".format(", ".join(recipients)))
-        except Exception as err:
-            print("Email failed: {}".format(err), file=sys.stderr)
+            print(f"Error: {smtp_error}", file=sys.stderr)
             sys.exit(1)
 
-    # Send via Telegram
     if args.telegram:
+        from briefbot_engine.delivery import telegram
+
         telegram_error = telegram.validate_telegram_config(config)
         if telegram_error:
-            print("Error: {}".format(telegram_error), file=sys.stderr)
+            print(f"Error: {telegram_error}", file=sys.stderr)
             sys.exit(1)
 
         # Resolve chat ID: CLI override > config default
@@ -147,35 +163,62 @@ def main():
         else:
             chat_id = args.telegram
 
-        # Build PDF for Telegram attachment (reuse if already created for email)
-        tg_pdf_path = None
-        if args.email and pdf_path:
-            tg_pdf_path = pdf_path
-        else:
-            try:
-                output_dir = MODULE_ROOT.parent / "output"
-                newsletter_html = email_delivery.build_newsletter_html(
-                    args.subject, briefing_text
-                )
-                tg_pdf_path = document.generate_pdf(
-                    newsletter_html, output_dir / "briefing.pdf"
-                )
-            except Exception as err:
-                print("PDF generation for Telegram failed: {}".format(err), file=sys.stderr)
-
-        try:
-            telegram.send_telegram_message(
+    send_failed = False
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Audio synthesis (network) and the PDF render (CPU) are independent,
+        # so they overlap; both must finish before anything is sent because
+        # email and Telegram attach them.
+        audio_future = (
+            pool.submit(_render_audio, briefing_text, config) if args.audio else None
+        )
+        pdf_future = (
+            pool.submit(_render_pdf, args.subject, briefing_text)
+            if args.email or args.telegram
+            else None
+        )
+        audio_path = audio_future.result() if audio_future else None
+        pdf_path = pdf_future.result() if pdf_future else None
+
+        # The two sends share nothing, so they also run side by side.
+        sends = {}
+        if args.email:
+            sends[pool.submit(
+                email_delivery.send_report_email,
+                recipient=args.email,
+                subject=args.subject,
+                markdown_body=briefing_text,
+                config=config,
+                audio_path=audio_path,
+                pdf_path=pdf_path,
+            )] = "email"
+        if args.telegram:
+            sends[pool.submit(
+                telegram.send_telegram_message,
                 chat_id=chat_id,
                 markdown_body=briefing_text,
                 subject=args.subject,
                 config=config,
                 audio_path=audio_path,
-                pdf_path=tg_pdf_path,
-            )
-            print("Telegram message sent to chat {}".format(chat_id))
-        except Exception as err:
-            print("Telegram failed: {}".format(err), file=sys.stderr)
-            sys.exit(1)
+                pdf_path=pdf_path,
+            )] = "telegram"
+
+        for future in as_completed(sends):
+            channel = sends[future]
+            try:
+                future.result()
+            except Exception as err:
+                label = "Email" if channel == "email" else "Telegram"
+                print(f"{label} failed: {err}", file=sys.stderr)
+                send_failed = True
+                continue
+            if channel == "email":
+                recipients = email_delivery.parse_recipients(args.email)
+                print(f"Email sent to {', '.join(recipients)}")
+            else:
+                print(f"Telegram message sent to chat {chat_id}")
+
+    if send_failed:
+        sys.exit(1)
 
     if not args.audio and not args.email and not args.telegram:
         print("Nothing to deliver. Use --audio, --email, and/or --telegram.", file=sys.stderr)
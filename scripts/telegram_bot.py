@@ -69,7 +69,7 @@ log = logging.getLogger("briefbot.telegram_bot")
 # ---------------------------------------------------------------------------
 
 POLL_TIMEOUT = 30  # seconds (Telegram long-polling)
-RECOGNIZED_FLAGS = {"--audio", "--web-plus"}
+RECOGNIZED_FLAGS = {"--audio", "--web-plus", "--refresh"}
 RECOGNIZED_KV_FLAGS = {"--span", "--feeds", "--sampling"}  # flags that take =VALUE
 
 # Additional @usernames the bot responds to (lowercase, without @)
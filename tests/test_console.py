@@ -0,0 +1,106 @@
+"""Tests for briefbot_engine.console -- terminal progress output."""
+
+from briefbot_engine import console
+
+
+# ---------------------------------------------------------------------------
+# Spinner (static path)
+# ---------------------------------------------------------------------------
+
+def test_static_spinner_prints_once_and_starts_no_thread(monkeypatch, capsys):
+    monkeypatch.setattr(console, "ANIMATED", False)
+    spinner = console.Spinner("Fetching")
+    spinner.start()
+    spinner.update("Still fetching")
+    spinner.stop("Done")
+
+    assert spinner.animation_thread is None
+    err = capsys.readouterr().err
+    assert err.count("Fetching") == 1
+    assert "Still fetching" not in err
+    assert err.endswith("Done\n")
+    assert "\r" not in err
+
+
+def test_static_spinner_stop_without_message_writes_nothing(monkeypatch, capsys):
+    monkeypatch.setattr(console, "ANIMATED", False)
+    spinner = console.Spinner("Fetching")
+    spinner.start()
+    capsys.readouterr()
+    spinner.stop()
+    assert capsys.readouterr().err == ""
+
+
+# ---------------------------------------------------------------------------
+# Message rotation
+# ---------------------------------------------------------------------------
+
+def test_rotation_visits_every_message_before_repeating():
+    messages = ["a", "b", "c", "d"]
+    rotation = console._rotation(messages)
+    first_lap = [next(rotation) for _ in messages]
+    assert sorted(first_lap) == messages
+    assert [next(rotation) for _ in messages] == first_lap
+
+
+# ---------------------------------------------------------------------------
+# Flushing
+# ---------------------------------------------------------------------------
+
+class _CountingStream:
+    def __init__(self):
+        self.text = ""
+        self.flushes = 0
+
+    def write(self, text):
+        self.text += text
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_phase_status_skips_flush_when_not_a_tty(monkeypatch):
+    stream = _CountingStream()
+    monkeypatch.setattr(console.sys, "stderr", stream)
+    monkeypatch.setattr(console, "IS_TTY", False)
+    console.phase_status("done", "All set")
+    assert stream.text.endswith("All set\n")
+    assert stream.flushes == 0
+
+    monkeypatch.setattr(console, "IS_TTY", True)
+    console.phase_status("done", "All set")
+    assert stream.flushes == 1
+
+
+# ---------------------------------------------------------------------------
+# Progress summaries
+# ---------------------------------------------------------------------------
+
+def test_show_summary_is_a_single_write(monkeypatch):
+    stream = _CountingStream()
+    writes = []
+    stream.write = writes.append
+    monkeypatch.setattr(console.sys, "stderr", stream)
+    progress = console.Progress("solar", display_header=False)
+    progress.show_summary(3, 4, youtube_count=2)
+
+    assert len(writes) == 1
+    assert "3 threads" in writes[0] and "4 posts" in writes[0]
+    assert "2 videos" in writes[0] and "LinkedIn" not in writes[0]
+
+
+# ---------------------------------------------------------------------------
+# Spinner (animated path)
+# ---------------------------------------------------------------------------
+
+def test_animated_spinner_stops_without_waiting_out_the_tick(monkeypatch, capsys):
+    monkeypatch.setattr(console, "ANIMATED", True)
+    spinner = console.Spinner("Fetching")
+    spinner.start()
+    assert spinner.active
+    started = console.time.monotonic()
+    spinner.stop("Done")
+    assert console.time.monotonic() - started < 0.09
+    assert not spinner.active
+    assert not spinner.animation_thread.is_alive()
+    assert capsys.readouterr().err.endswith("Done\n")
@@ -0,0 +1,31 @@
+"""Tests for the standalone delivery script (scripts/deliver.py)."""
+
+import os
+
+import deliver
+from briefbot_engine.delivery.email import _markdown_to_news_html
+
+
+def _read(path):
+    return deliver._read_briefing(path, os.stat(path).st_size)
+
+
+def test_read_briefing_translates_crlf(tmp_path):
+    path = tmp_path / "briefing.md"
+    path.write_bytes(b"# Head\r\n\r\npara one\r\n\r\n---\r\n\r\npara two\rend\r\n")
+
+    text = _read(path)
+
+    assert text == "# Head\n\npara one\n\n---\n\npara two\nend\n"
+    assert text == path.read_text(encoding="utf-8")
+    html = _markdown_to_news_html(text)
+    assert "\r" not in html
+    assert "Head</h1>" in html
+    assert "<hr" in html
+
+
+def test_read_briefing_empty_file(tmp_path):
+    path = tmp_path / "briefing.md"
+    path.write_bytes(b"")
+
+    assert _read(path) == ""
@@ -2,11 +2,14 @@
 
 import pytest
 
+from briefbot_engine.delivery import email as email_delivery
 from briefbot_engine.delivery.email import (
     validate_smtp_config,
     _markdown_to_news_html,
     parse_recipients,
     _build_email_message,
+    send_report_email,
+    smtp_session,
 )
 
 
@@ -83,6 +86,20 @@ def test_markdown_to_html_inline_code():
     assert "pip install" in html
 
 
+def test_markdown_to_html_header_levels():
+    html = _markdown_to_news_html("# One\n## Two\n### Three\n#### Four")
+    assert "<h1" in html and ">One</h1>" in html
+    assert "<h2" in html and ">Two</h2>" in html
+    assert "<h3" in html and ">Three</h3>" in html
+    assert "#### Four" in html
+
+
+def test_markdown_to_html_paragraphs_skip_blank_runs():
+    html = _markdown_to_news_html("First\n\n  \n\nSecond\nline")
+    assert html.count("<p ") == 2
+    assert "Second<br>\nline</p>" in html
+
+
 # ---------------------------------------------------------------------------
 # parse_recipients()
 # ---------------------------------------------------------------------------
@@ -155,3 +172,91 @@ def test_build_email_has_text_and_html_parts():
     content_types = [part.get_content_type() for part in alt_part.get_payload()]
     assert "text/plain" in content_types
     assert "text/html" in content_types
+
+
+def test_build_email_attachments_round_trip(tmp_path):
+    pdf = tmp_path / "brief.pdf"
+    audio = tmp_path / "brief.mp3"
+    pdf.write_bytes(bytes(range(256)) * 4000)
+    audio.write_bytes(b"ID3" + bytes(range(200)) * 7)
+    msg = _build_email_message(
+        recipients=["alice@example.com"],
+        subject="Report",
+        markdown_body="Body",
+        sender="bot@example.com",
+        audio_path=audio,
+        pdf_path=pdf,
+    )
+    parts = {part.get_filename(): part for part in msg.get_payload()[1:]}
+    assert parts["brief.pdf"].get_content_type() == "application/pdf"
+    assert parts["brief.pdf"]["Content-Transfer-Encoding"] == "base64"
+    assert parts["brief.pdf"].get_payload(decode=True) == pdf.read_bytes()
+    assert parts["brief.mp3"].get_content_type() == "application/mpeg"
+    assert parts["brief.mp3"].get_payload(decode=True) == audio.read_bytes()
+    assert all(len(line) <= 76 for line in parts["brief.pdf"].get_payload().splitlines())
+
+
+# ---------------------------------------------------------------------------
+# smtp_session() / send_report_email()
+# ---------------------------------------------------------------------------
+
+SMTP_CONFIG = {
+    "SMTP_HOST": "smtp.example.com",
+    "SMTP_USER": "user@example.com",
+    "SMTP_PASSWORD": "secret",
+}
+
+
+class _FakeSMTP:
+    instances = []
+
+    def __init__(self, host, port):
+        self.calls = [("connect", host, port)]
+        _FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        self.calls.append(("starttls",))
+
+    def login(self, user, password):
+        self.calls.append(("login", user))
+
+    def send_message(self, msg, from_addr=None, to_addrs=None):
+        self.calls.append(("send", from_addr, tuple(to_addrs)))
+
+    def quit(self):
+        self.calls.append(("quit",))
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    _FakeSMTP.instances = []
+    monkeypatch.setattr(email_delivery.smtplib, "SMTP", _FakeSMTP)
+    return _FakeSMTP
+
+
+def test_send_report_email_single_transaction_for_all_recipients(fake_smtp):
+    send_report_email("a@example.com, b@example.com", "Brief", "Body", SMTP_CONFIG)
+    (server,) = fake_smtp.instances
+    assert server.calls == [
+        ("connect", "smtp.example.com", 587),
+        ("starttls",),
+        ("login", "user@example.com"),
+        ("send", "user@example.com", ("a@example.com", "b@example.com")),
+        ("quit",),
+    ]
+
+
+def test_smtp_session_reused_across_sends(fake_smtp):
+    with smtp_session(SMTP_CONFIG) as server:
+        send_report_email("a@example.com", "One", "Body", SMTP_CONFIG, session=server)
+        send_report_email("b@example.com", "Two", "Body", SMTP_CONFIG, session=server)
+    assert len(fake_smtp.instances) == 1
+    calls = [c[0] for c in fake_smtp.instances[0].calls]
+    assert calls == ["connect", "starttls", "login", "send", "send", "quit"]
+
+
+def test_smtp_session_rejects_incomplete_config(fake_smtp):
+    with pytest.raises(ValueError):
+        with smtp_session({"SMTP_HOST": "smtp.example.com"}):
+            pass
+    assert fake_smtp.instances == []
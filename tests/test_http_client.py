@@ -0,0 +1,105 @@
+"""Tests for briefbot_engine.http_client -- pooled keep-alive transport."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from briefbot_engine import http_client
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    posts = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/a")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status = 404 if self.path == "/missing" else 200
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        type(self).posts += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(307)
+        self.send_header("Location", "/a")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server(monkeypatch):
+    for var in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+    _KeepAliveHandler.connections = 0
+    _KeepAliveHandler.posts = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    http_client.close_pool()
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_to_one_host_share_a_connection(local_server):
+    first = http_client.get(f"{local_server}/a")
+    second = http_client.get(f"{local_server}/b")
+    assert first == {"path": "/a"}
+    assert second == {"path": "/b"}
+    assert _KeepAliveHandler.connections == 1
+
+
+def test_pooled_error_status_raises_transport_error(local_server):
+    with pytest.raises(http_client.TransportError) as excinfo:
+        http_client.get(f"{local_server}/missing")
+    assert excinfo.value.status_code == 404
+
+
+def test_pooled_get_follows_redirect(local_server):
+    assert http_client.get(f"{local_server}/moved") == {"path": "/a"}
+
+
+def test_pooled_post_redirect_is_not_resent(local_server):
+    with pytest.raises(http_client.TransportError) as excinfo:
+        http_client.post(f"{local_server}/moved", {"q": 1})
+    assert excinfo.value.status_code == 307
+    assert _KeepAliveHandler.posts == 1
+
+
+def test_releases_pool_closes_worker_connections(local_server):
+    from concurrent.futures import ThreadPoolExecutor
+
+    @http_client.releases_pool
+    def task():
+        http_client.get(f"{local_server}/a")
+        http_client.get(f"{local_server}/b")
+        return dict(http_client._POOL.connections)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        opened = pool.submit(task).result()
+        remaining = pool.submit(lambda: dict(http_client._POOL.connections)).result()
+
+    assert _KeepAliveHandler.connections == 1
+    assert len(opened) == 1
+    assert all(conn.sock is None for conn in opened.values())
+    assert remaining == {}
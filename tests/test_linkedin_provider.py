@@ -0,0 +1,107 @@
+"""Tests for the LinkedIn provider module (briefbot_engine.sources.linkedin_feed)."""
+
+import json
+
+import pytest
+
+from briefbot_engine.sources import catalog, linkedin_feed
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog._registry, "CACHE_DIR", tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# _trim_query()
+# ---------------------------------------------------------------------------
+
+def test_trim_query_strips_filler_phrases():
+    assert linkedin_feed._trim_query("how to deploy kubernetes") == "deploy kubernetes"
+
+
+def test_trim_query_keeps_fillers_inside_words():
+    assert linkedin_feed._trim_query("topology reviewers") == "topology reviewers"
+
+
+def test_trim_query_falls_back_to_topic_when_nothing_remains():
+    assert linkedin_feed._trim_query("best guide") == "best guide"
+
+
+# ---------------------------------------------------------------------------
+# _extract_items()
+# ---------------------------------------------------------------------------
+
+def test_extract_items_skips_leading_prose():
+    text = 'Here is what I found {see below}:\n{"posts": [{"url": "x"}]}'
+    assert linkedin_feed._extract_items(text) == [{"url": "x"}]
+
+
+def test_extract_items_ignores_objects_without_posts():
+    assert linkedin_feed._extract_items('{"note": 1} and {"other": []}') == []
+
+
+# ---------------------------------------------------------------------------
+# parse_linkedin_response()
+# ---------------------------------------------------------------------------
+
+def test_parse_linkedin_response_reads_fixture_signals(FIXTURES_DIR):
+    response = json.loads((FIXTURES_DIR / "linkedin_sample.json").read_text(encoding="utf-8"))
+
+    items = linkedin_feed.parse_linkedin_response(response)
+
+    assert len(items) == 1
+    assert items[0]["signals"] == {"reactions": 210, "comments": 19}
+
+
+def test_parse_linkedin_response_falls_back_to_metrics_and_link():
+    posts = {
+        "posts": [
+            {"link": "https://www.linkedin.com/posts/a", "metrics": {"reactions": 5, "comments": 0}},
+            {"url": "https://www.linkedin.com/posts/b"},
+        ]
+    }
+    response = {"output": json.dumps(posts)}
+
+    items = linkedin_feed.parse_linkedin_response(response)
+
+    assert items[0]["url"] == "https://www.linkedin.com/posts/a"
+    assert items[0]["signals"] == {"reactions": 5, "comments": None}
+    assert items[1]["signals"] == {"reactions": None, "comments": None}
+
+
+def test_parse_linkedin_response_treats_null_text_fields_as_empty():
+    posts = {"posts": [{"url": "https://www.linkedin.com/posts/a", "author": None, "role": "  CTO  "}]}
+
+    items = linkedin_feed.parse_linkedin_response({"output": json.dumps(posts)})
+
+    assert items[0]["author"] == ""
+    assert items[0]["role"] == "CTO"
+
+
+def test_parse_linkedin_response_drops_repeated_urls():
+    posts = {
+        "posts": [
+            {"url": "https://www.linkedin.com/posts/a"},
+            {"url": "https://www.linkedin.com/posts/a/?utm_source=share"},
+            {"url": "https://example.com/posts/b"},
+        ]
+    }
+
+    items = linkedin_feed.parse_linkedin_response({"output": json.dumps(posts)})
+
+    assert [item["url"] for item in items] == ["https://www.linkedin.com/posts/a"]
+
+
+def test_parse_linkedin_response_clamps_topicality():
+    posts = {
+        "posts": [
+            {"url": "https://www.linkedin.com/posts/a", "topicality": 1.7},
+            {"url": "https://www.linkedin.com/posts/b", "topicality": "high"},
+            {"url": "https://www.linkedin.com/posts/c", "signal": -2},
+        ]
+    }
+
+    items = linkedin_feed.parse_linkedin_response({"output": json.dumps(posts)})
+
+    assert [item["topicality"] for item in items] == [1.0, 0.5, 0.0]
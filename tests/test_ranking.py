@@ -208,6 +208,30 @@ class TestRankItems:
         assert len(result) == 2
         assert all(item.rank > 0 for item in result)
 
+    def test_source_weights_scale_and_clamp_matching_channel(self):
+        items = [
+            _make_reddit_item(
+                "k8s-weighted",
+                "Kubernetes service mesh adoption on Reddit",
+                topicality=0.90,
+                interaction=Interaction(upvotes=340, comments=87, ratio=0.92, pulse=6.5),
+                dated=_today(),
+            ),
+            _make_web_item(
+                "k8s-unweighted",
+                "Kubernetes service mesh adoption web article",
+                topicality=0.90,
+                dated=_today(),
+            ),
+        ]
+
+        result = scoring.rank_items(items, source_weights={"reddit": 60.0, "web": 1.0})
+        by_key = {item.key: item for item in result}
+
+        assert by_key["k8s-weighted"].rank == 100
+        assert by_key["k8s-weighted"].extras["stance_weight"] == 60.0
+        assert "stance_weight" not in by_key["k8s-unweighted"].extras
+
 
 class TestDeduplicate:
     def test_empty_list_returns_empty(self):
@@ -313,3 +337,93 @@ class TestDeduplicate:
 
         result = scoring.deduplicate([item_a, item_b], similarity_threshold=1.0)
         assert len(result) == 2
+
+    def test_contained_signature_matches_despite_length_gap(self):
+        item_short = Signal(
+            key="qec-short",
+            channel=Channel.REDDIT,
+            headline="Quantum error correction",
+            url="https://reddit.com/r/quantum/short",
+            rank=40,
+        )
+        item_long = Signal(
+            key="qec-long",
+            channel=Channel.REDDIT,
+            headline="Quantum error correction breakthrough at IBM research labs this week",
+            url="https://reddit.com/r/quantum/long",
+            rank=70,
+        )
+
+        lenient = scoring.deduplicate([item_short, item_long], similarity_threshold=0.9)
+        strict = scoring.deduplicate([item_short, item_long], similarity_threshold=0.95)
+
+        assert [item.key for item in lenient] == ["qec-long"]
+        assert len(strict) == 2
+
+    def test_strict_threshold_still_matches_url_twins_of_any_length(self):
+        item_short = Signal(
+            key="url-short",
+            channel=Channel.WEB,
+            headline="IBM qubits",
+            url="https://example.com/ibm-qubits/",
+            rank=30,
+        )
+        item_other = Signal(
+            key="other",
+            channel=Channel.WEB,
+            headline="Rust memory safety guarantees",
+            url="https://example.com/rust",
+            rank=50,
+        )
+        item_long = Signal(
+            key="url-long",
+            channel=Channel.WEB,
+            headline="IBM announces a new generation of error-corrected qubits",
+            url="https://example.com/ibm-qubits?ref=feed",
+            rank=60,
+        )
+
+        result = scoring.deduplicate([item_short, item_other, item_long], similarity_threshold=0.97)
+
+        assert [item.key for item in result] == ["other", "url-long"]
+
+
+class TestSquash:
+    def test_signature_memoized_per_text(self):
+        scoring._squash.cache_clear()
+        first = scoring._squash("Rust 2.0: Memory-Safety, Revisited!")
+        again = scoring._squash("Rust 2.0: Memory-Safety, Revisited!")
+
+        assert first == b"rust 2 0 memory safety revisited"
+        assert again is first
+        assert scoring._squash.cache_info().hits == 1
+
+
+class TestOverlapBound:
+    def test_never_below_sequence_matcher_ratio(self):
+        from collections import Counter
+        from difflib import SequenceMatcher
+
+        samples = [
+            b"quantum error correction",
+            b"error correction quantum",
+            b"rust memory safety",
+            b"kubernetes service mesh adoption",
+            b"",
+        ]
+        for a in samples:
+            for b in samples:
+                ratio = SequenceMatcher(None, a, b, autojunk=False).ratio() if a and b else 0.0
+                bound = scoring._overlap_bound(Counter(a), Counter(b), len(a) + len(b))
+                assert bound >= ratio
+
+
+class TestJaccardSimilarity:
+    def test_edge_cases(self):
+        assert scoring.jaccard_similarity([], []) == 1.0
+        assert scoring.jaccard_similarity(["a"], []) == 0.0
+        assert scoring.jaccard_similarity([], ["a"]) == 0.0
+
+    def test_overlap_ratio(self):
+        assert scoring.jaccard_similarity(["a", "b", "c"], ["b", "c", "d"]) == 0.5
+        assert scoring.jaccard_similarity("abc", "cab") == 1.0
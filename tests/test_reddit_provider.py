@@ -2,10 +2,20 @@
 
 import pytest
 
-from briefbot_engine.sources.reddit_source import _is_access_err, FALLBACK_MODELS
+from briefbot_engine.sources import catalog, reddit_source
+from briefbot_engine.sources.reddit_source import (
+    _extract_threads_blob,
+    _is_access_err,
+    FALLBACK_MODELS,
+)
 from briefbot_engine.http_client import HTTPError
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog._registry, "CACHE_DIR", tmp_path)
+
+
 # ---------------------------------------------------------------------------
 # _is_access_err()
 # ---------------------------------------------------------------------------
@@ -47,6 +57,11 @@ def test_is_access_err_returns_true_for_not_found():
     assert _is_access_err(err) is True
 
 
+def test_is_access_err_matches_case_insensitively():
+    err = HTTPError("Forbidden", status_code=403, response_body="ACCESS DENIED for this project")
+    assert _is_access_err(err) is True
+
+
 def test_is_access_err_returns_false_for_unrelated_400():
     err = HTTPError(
         "Bad request",
@@ -56,6 +71,24 @@ def test_is_access_err_returns_false_for_unrelated_400():
     assert _is_access_err(err) is False
 
 
+# ---------------------------------------------------------------------------
+# _extract_threads_blob()
+# ---------------------------------------------------------------------------
+
+def test_extract_threads_blob_skips_leading_prose():
+    text = 'Found these {maybe} threads:\n{"threads": [{"headline": "A"}]} done'
+    assert _extract_threads_blob(text) == [{"headline": "A"}]
+
+
+def test_extract_threads_blob_falls_back_when_anchor_is_malformed():
+    text = '{"threads": [broken {"threads": [{"headline": "B"}]}'
+    assert _extract_threads_blob(text) == [{"headline": "B"}]
+
+
+def test_extract_threads_blob_returns_empty_without_json():
+    assert _extract_threads_blob("no structured output here") == []
+
+
 # ---------------------------------------------------------------------------
 # FALLBACK_MODELS
 # ---------------------------------------------------------------------------
@@ -66,3 +99,110 @@ def test_fallback_models_contains_gpt41():
 
 def test_fallback_models_first_item_is_gpt41_mini():
     assert FALLBACK_MODELS[0] == "gpt-4.1-mini"
+
+
+# ---------------------------------------------------------------------------
+# search() model fallback
+# ---------------------------------------------------------------------------
+
+def test_search_skips_models_already_refused_for_key(monkeypatch):
+    monkeypatch.setattr(reddit_source, "_UNAVAILABLE_MODELS", set())
+    attempted = []
+
+    def fake_request(method, url, headers=None, json_body=None, timeout=None):
+        attempted.append(json_body["model"])
+        if json_body["model"] == "gpt-5":
+            raise HTTPError("Bad request", status_code=400, response_body="The model `gpt-5` was not found.")
+        return {"output": []}
+
+    monkeypatch.setattr(reddit_source.http_client, "request", fake_request)
+
+    reddit_source.search("sk-test", "gpt-5", "solar panels", "2026-01-01", "2026-01-31")
+    reddit_source.search("sk-test", "gpt-5", "heat pumps", "2026-01-01", "2026-01-31")
+
+    assert attempted == ["gpt-5", "gpt-4.1-mini", "gpt-4.1-mini"]
+
+
+def test_parse_reddit_response_drops_repeated_thread_urls():
+    text = (
+        '{"threads": ['
+        '{"headline": "A", "url": "https://www.reddit.com/r/solar/comments/1/a/"},'
+        '{"headline": "A again", "url": "https://www.reddit.com/r/solar/comments/1/a?context=3"}'
+        "]}"
+    )
+    response = {"output": [{"content": [{"text": text}]}]}
+
+    items = reddit_source.parse_reddit_response(response)
+
+    assert [item["headline"] for item in items] == ["A"]
+
+
+def test_search_reuses_cached_response_for_same_inputs(monkeypatch):
+    calls = []
+
+    def fake_request(method, url, headers=None, json_body=None, timeout=None):
+        calls.append(json_body["model"])
+        text = '{"threads": [{"headline": "A", "url": "https://www.reddit.com/r/solar/comments/1/a/"}]}'
+        return {"output": [{"content": [{"text": text}]}]}
+
+    monkeypatch.setattr(reddit_source.http_client, "request", fake_request)
+
+    first = reddit_source.search("sk-test", "gpt-4.1", "solar panels", "2026-01-01", "2026-01-31")
+    second = reddit_source.search("sk-test", "gpt-4.1", "solar panels", "2026-01-01", "2026-01-31")
+    reddit_source.search("sk-test", "gpt-4.1", "solar panels", "2026-01-01", "2026-01-31", use_cache=False)
+
+    assert first == second
+    assert len(calls) == 2
+
+
+def test_search_does_not_cache_replies_without_threads(monkeypatch):
+    calls = []
+
+    def fake_request(method, url, headers=None, json_body=None, timeout=None):
+        calls.append(json_body["model"])
+        return {"output": [{"content": [{"text": '{"threads": []}'}]}]}
+
+    monkeypatch.setattr(reddit_source.http_client, "request", fake_request)
+
+    reddit_source.search("sk-test", "gpt-4.1", "solar panels", "2026-01-01", "2026-01-31")
+    reddit_source.search("sk-test", "gpt-4.1", "solar panels", "2026-01-01", "2026-01-31")
+
+    assert len(calls) == 2
+
+
+def test_search_does_not_parse_reply_itself(monkeypatch):
+    def fake_request(method, url, headers=None, json_body=None, timeout=None):
+        text = '{"threads": [{"headline": "A", "url": "https://www.reddit.com/r/solar/comments/1/a/"}]}'
+        return {"output": [{"content": [{"text": text}]}]}
+
+    def fail_parse(response):
+        raise AssertionError("search() must leave parsing to the caller")
+
+    monkeypatch.setattr(reddit_source.http_client, "request", fake_request)
+    monkeypatch.setattr(reddit_source, "parse_reddit_response", fail_parse)
+
+    response = reddit_source.search("sk-test", "gpt-4.1", "solar panels", "2026-01-01", "2026-01-31")
+
+    assert catalog.load(catalog.cache_key(
+        "solar panels", "2026-01-01", "2026-01-31", "reddit:standard:gpt-4.1"
+    )) == response
+
+
+# ---------------------------------------------------------------------------
+# _pick_output_text()
+# ---------------------------------------------------------------------------
+
+def test_pick_output_text_returns_first_nonempty_block_in_order():
+    response = {
+        "output": [
+            {"type": "web_search_call", "content": [{"text": "  "}]},
+            {"type": "message", "content": [{"type": "output_text", "text": "first"}, {"text": "second"}]},
+            "third",
+        ]
+    }
+    assert reddit_source._pick_output_text(response) == "first"
+
+
+def test_pick_output_text_falls_back_to_choices():
+    response = {"output": [], "choices": [{"message": {"content": " from choices "}}]}
+    assert reddit_source._pick_output_text(response) == "from choices"
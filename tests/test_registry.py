@@ -4,6 +4,7 @@ Replaces test_cache.py and test_models.py with pure pytest functions
 importing from the refactored briefbot_engine package.
 """
 
+import os
 from pathlib import Path
 
 import pytest
@@ -56,6 +57,87 @@ class TestIsValid:
         assert catalog.is_valid(fake_path) is False
 
 
+class TestSaveLoad:
+    @pytest.fixture
+    def registry(self, tmp_path, monkeypatch):
+        reg = ProviderRegistry()
+        monkeypatch.setattr(reg, "CACHE_DIR", tmp_path)
+        return reg
+
+    def test_round_trip_preserves_unicode(self, registry):
+        payload = {"items": [{"title": "Caf\u00e9 \u2014 r\u00e9sum\u00e9", "score": 12}]}
+        registry.save("k1", payload)
+        assert registry.load("k1") == payload
+        data, hours = registry.load_with_age("k1")
+        assert data == payload
+        assert 0 <= hours < 1
+
+    def test_entry_older_than_ttl_is_a_miss(self, registry):
+        registry.save("old", {"items": []})
+        fp = registry.cache_path("old")
+        stale = fp.stat().st_mtime - 3 * 3600
+        os.utime(fp, (stale, stale))
+        assert registry.load("old", ttl_hours=2) is None
+        data, hours = registry.load_with_age("old", ttl_hours=4)
+        assert data == {"items": []}
+        assert 2.9 < hours < 3.1
+
+    def test_save_replaces_atomically_and_leaves_no_temp_files(self, registry, tmp_path, monkeypatch):
+        registry.save("k2", {"v": 1})
+        registry.save("k2", {"v": 2})
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["k2.json"]
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(catalog.os, "replace", failing_replace)
+        registry.save("k2", {"v": 3})
+        assert registry.load("k2") == {"v": 2}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["k2.json"]
+
+    def test_is_valid_and_age_hours_accept_a_shared_now(self, registry):
+        registry.save("k3", {})
+        fp = registry.cache_path("k3")
+        mtime = fp.stat().st_mtime
+        assert registry.age_hours(fp, now=mtime + 5400) == pytest.approx(1.5)
+        assert registry.is_valid(fp, ttl_hours=2, now=mtime + 5400)
+        assert not registry.is_valid(fp, ttl_hours=1, now=mtime + 5400)
+        assert registry.age_hours(fp.with_name("missing.json")) is None
+
+    def test_corrupt_file_reads_as_miss(self, registry):
+        registry._ensure_dir()
+        registry.cache_path("bad").write_bytes(b"{not json\xff")
+        assert registry.load("bad") is None
+        assert registry.load_with_age("bad") == (None, None)
+
+
+class TestModelPrefsCache:
+    @pytest.fixture
+    def registry(self, tmp_path, monkeypatch):
+        reg = ProviderRegistry()
+        monkeypatch.setattr(reg, "CACHE_DIR", tmp_path)
+        reg._model_file = tmp_path / "model_prefs.json"
+        return reg
+
+    def test_unchanged_file_is_not_reparsed(self, registry, monkeypatch):
+        registry.set_cached_model("openai", "gpt-5.2")
+        calls = []
+        monkeypatch.setattr(catalog, "_loads", lambda raw: calls.append(raw) or {})
+        assert registry.get_cached_model("openai") == "gpt-5.2"
+        assert registry.get_cached_model("openai") == "gpt-5.2"
+        assert calls == []
+
+    def test_external_rewrite_is_picked_up(self, registry):
+        registry.set_cached_model("xai", "grok-4")
+        registry._model_file.write_text('{"xai": "grok-4-fast-reasoning"}')
+        assert registry.get_cached_model("xai") == "grok-4-fast-reasoning"
+
+    def test_returned_prefs_are_a_copy(self, registry):
+        registry.set_cached_model("xai", "grok-4")
+        registry._load_model_prefs()["xai"] = "edited"
+        assert registry.get_cached_model("xai") == "grok-4"
+
+
 class TestGetCachedModel:
     def test_unknown_provider_returns_none(self):
         result = catalog.get_cached_model("nonexistent_provider_xyz_12345")
@@ -0,0 +1,32 @@
+"""Tests for the shared source helpers (briefbot_engine.sources.fields)."""
+
+from briefbot_engine.http_client import HTTPError
+from briefbot_engine.sources import fields, linkedin_feed, reddit_source, youtube_feed
+
+
+def test_first_skips_missing_and_none_values():
+    assert fields.first({"title": None, "headline": "A"}, ("title", "headline")) == "A"
+    assert fields.first({}, ("url", "link"), default="") == ""
+
+
+def test_text_strips_and_stringifies():
+    assert fields.text("  hi ") == "hi"
+    assert fields.text(None) == ""
+    assert fields.text(42) == "42"
+
+
+def test_unit_score_clamps_and_defaults():
+    assert fields.unit_score("0.7") == 0.7
+    assert fields.unit_score(3) == 1.0
+    assert fields.unit_score(-1) == 0.0
+    assert fields.unit_score("n/a") == 0.5
+
+
+def test_access_error_shared_across_sources():
+    refused = HTTPError("Not found", status_code=404, response_body="The Model gpt-x was Not Found")
+    unauthorized = HTTPError("Unauthorized", status_code=401, response_body="Unauthorized")
+
+    for check in (reddit_source._is_access_err, linkedin_feed._is_access_err, youtube_feed._is_access_err):
+        assert check(refused) is True
+    assert reddit_source._is_access_err(unauthorized) is True
+    assert linkedin_feed._is_access_err(unauthorized) is False
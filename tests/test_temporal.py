@@ -10,6 +10,7 @@ from briefbot_engine.timeframe import (
     date_confidence,
     days_since,
     detect_date,
+    is_iso_date,
     parse_moment,
     recency_score,
     scan_text_date,
@@ -233,6 +234,19 @@ def test_recency_score_beyond_max_days_is_0():
     assert result == 0
 
 
+# ---------------------------------------------------------------------------
+# is_iso_date()
+# ---------------------------------------------------------------------------
+
+def test_is_iso_date_accepts_exact_shape():
+    assert is_iso_date("2026-02-07") is True
+
+
+def test_is_iso_date_rejects_other_shapes():
+    for value in ("2026-2-07", "2026/02/07", "2026-02-07T10:00", "20260207", "abcd-ef-gh", ""):
+        assert is_iso_date(value) is False
+
+
 # ---------------------------------------------------------------------------
 # scan_url_date()
 # ---------------------------------------------------------------------------
@@ -261,6 +275,27 @@ def test_scan_url_date_yyyy_mm_dd_dashes():
     assert result == "2026-01-28"
 
 
+def test_scan_url_date_skips_out_of_range_match():
+    url = "https://example.com/1999/01/01/archive/2026/03/09/post"
+
+    result = scan_url_date(url)
+
+    assert result == "2026-03-09"
+
+
+def test_scan_url_date_id_segment_before_slash_date():
+    assert scan_url_date("https://site.com/12345678/2024/05/01/title") == "2024-05-01"
+    assert scan_url_date("https://x.com/19991231/2020/01/01/") == "2020-01-01"
+
+
+def test_scan_url_date_prefers_slash_form_over_earlier_dashes():
+    url = "https://example.com/2024-02-03-recap/2025/06/07/post"
+
+    result = scan_url_date(url)
+
+    assert result == "2025-06-07"
+
+
 def test_scan_url_date_no_date_returns_none():
     url = "https://en.wikipedia.org/wiki/Perovskite_solar_cell"
 
@@ -373,3 +408,53 @@ def test_detect_date_returns_none_when_no_date():
 
     assert date is None
     assert confidence == CONFIDENCE_UNKNOWN
+
+
+def test_scan_text_date_resolves_relative_phrases_against_now():
+    now = datetime(2026, 3, 10, 12, 0)
+
+    assert scan_text_date("Posted yesterday", now) == "2026-03-09"
+    assert scan_text_date("Updated 3 days ago", now) == "2026-03-07"
+
+
+def test_recency_score_uses_supplied_today():
+    today = datetime(2026, 3, 10).date()
+
+    assert recency_score("2026-03-10", today=today) == 100
+    assert recency_score("2026-01-01", today=today) == 0
+
+
+def test_date_confidence_accepts_parsed_range_bounds():
+    start = datetime(2026, 1, 1).date()
+    end = datetime(2026, 1, 31).date()
+
+    assert date_confidence("2026-01-15", start, end) == CONFIDENCE_SOLID
+    assert date_confidence("2026-02-03", start, end) == CONFIDENCE_SOFT
+
+
+def test_parse_moment_dispatches_on_string_shape():
+    assert parse_moment("March 5, 2026").date().isoformat() == "2026-03-05"
+    assert parse_moment("05/03/2026").date().isoformat() == "2026-03-05"
+    assert parse_moment("1767225600").date().isoformat() == "2026-01-01"
+    assert parse_moment("not a date") is None
+
+
+def test_parse_moment_unpadded_iso_dates():
+    for text in ("2026-1-5", "2026-01-5", "2026-1-05"):
+        assert parse_moment(text).date().isoformat() == "2026-01-05"
+
+
+def test_day_helpers_accept_unpadded_iso_dates():
+    for text in ("2026-1-5", "2026-01-5", "2026-1-05"):
+        assert date_confidence(text, "2026-01-01", "2026-01-31") == CONFIDENCE_SOLID
+        assert days_since(text, datetime(2026, 1, 12).date()) == 7
+    assert date_confidence("20260105", "2026-01-01", "2026-01-31") == CONFIDENCE_UNKNOWN
+
+
+def test_today_utc_follows_the_unix_day(monkeypatch):
+    from briefbot_engine import timeframe
+
+    monkeypatch.setattr(timeframe.time, "time", lambda: 1767225599.9)  # 2025-12-31T23:59:59.9Z
+    assert timeframe.today_utc().isoformat() == "2025-12-31"
+    monkeypatch.setattr(timeframe.time, "time", lambda: 1767225600.0)
+    assert timeframe.today_utc().isoformat() == "2026-01-01"
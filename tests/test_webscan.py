@@ -0,0 +1,61 @@
+"""Tests for briefbot_engine.sources.webscan -- web result normalisation."""
+
+from briefbot_engine.records import Channel, Signal
+from briefbot_engine.sources import webscan
+
+
+# ---------------------------------------------------------------------------
+# _domain()
+# ---------------------------------------------------------------------------
+
+def test_domain_strips_scheme_www_and_path():
+    assert webscan._domain("https://www.Example.com/a/b?q=1") == "example.com"
+
+
+def test_domain_stops_at_query_or_fragment():
+    assert webscan._domain("https://news.example.org?id=3") == "news.example.org"
+    assert webscan._domain("http://example.org#top") == "example.org"
+
+
+def test_domain_handles_scheme_less_urls():
+    assert webscan._domain("www.example.net/path") == "example.net"
+
+
+# ---------------------------------------------------------------------------
+# process_results()
+# ---------------------------------------------------------------------------
+
+def test_process_results_skips_excluded_domains():
+    raw = [
+        {"url": "https://www.reddit.com/r/solar/comments/1/a/", "title": "Thread"},
+        {"url": "https://pv-magazine.com/2026/02/14/perovskite/", "title": "Perovskite record"},
+    ]
+
+    items = webscan.process_results(raw, "perovskite")
+
+    assert [item["domain"] for item in items] == ["pv-magazine.com"]
+    assert items[0]["dated"] == "2026-02-14"
+
+
+def test_is_excluded_matches_subdomains_but_not_lookalikes():
+    assert webscan._is_excluded("https://news.reddit.com/r/x")
+    assert webscan._is_excluded("https://x.com/user/status/1")
+    assert not webscan._is_excluded("https://notreddit.com/post")
+
+
+# ---------------------------------------------------------------------------
+# dedup_urls()
+# ---------------------------------------------------------------------------
+
+def test_dedup_urls_normalises_www_query_slash_and_case():
+    urls = [
+        "https://www.Example.com/post/?utm=1",
+        "https://example.com/post",
+        "HTTPS://WWW.example.com/Post/",
+        "https://example.com/other",
+    ]
+    items = [Signal(key=f"W{i}", channel=Channel.WEB, headline="", url=url) for i, url in enumerate(urls)]
+
+    unique = webscan.dedup_urls(items)
+
+    assert [item.key for item in unique] == ["W0", "W3"]